@@ -0,0 +1,163 @@
+"""
+Calibração do custo do Argon2 para a máquina atual.
+
+Mede o tempo de verificação de senha para uma grade de parâmetros
+(memória, iterações, paralelismo) e recomenda a combinação mais forte
+cujo p95 cabe no orçamento de latência. O resultado sai no formato do
+`.env` (ARGON2_*), lido pelo `Settings` e usado pelo `Password`.
+
+Rode no mesmo tipo de máquina/pod que atende o login.
+
+Uso:
+    uv run python -m app.commands.calibrate_argon2 --target-ms 50
+"""
+
+import argparse
+import itertools
+import math
+import sys
+import time
+from dataclasses import dataclass
+
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+DEFAULT_MEMORY_COSTS = (19456, 32768, 47104, 65536, 131072)  # KiB
+DEFAULT_TIME_COSTS = (1, 2, 3, 4)
+DEFAULT_PARALLELISMS = (1, 2, 4)
+SAMPLE_PASSWORD = "Calibr@cao-Argon2"
+
+
+@dataclass(frozen=True)
+class Measurement:
+    memory_cost: int
+    time_cost: int
+    parallelism: int
+    p50_ms: float
+    p95_ms: float
+
+    @property
+    def strength(self) -> int:
+        """Custo total aproximado (KiB x iterações) para desempate."""
+        return self.memory_cost * self.time_cost
+
+    def as_env(self) -> str:
+        return (
+            f"ARGON2_TIME_COST={self.time_cost}\n"
+            f"ARGON2_MEMORY_COST={self.memory_cost}\n"
+            f"ARGON2_PARALLELISM={self.parallelism}"
+        )
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Percentil pelo método nearest-rank."""
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def measure(
+    memory_cost: int, time_cost: int, parallelism: int, samples: int
+) -> Measurement:
+    """Mede `samples` verificações (o caminho do login) com os parâmetros."""
+    hasher = Argon2Hasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+    )
+    hashed = hasher.hash(SAMPLE_PASSWORD)
+
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.verify(SAMPLE_PASSWORD, hashed)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return Measurement(
+        memory_cost,
+        time_cost,
+        parallelism,
+        p50_ms=percentile(timings, 50),
+        p95_ms=percentile(timings, 95),
+    )
+
+
+def recommend(
+    measurements: list[Measurement], target_ms: float
+) -> Measurement | None:
+    """
+    Escolhe a combinação mais forte dentro do orçamento. Em empate,
+    prefere menos paralelismo (menos threads por login concorrente) e
+    depois o menor p95.
+    """
+    within = [m for m in measurements if m.p95_ms <= target_ms]
+    if not within:
+        return None
+    return max(within, key=lambda m: (m.strength, -m.parallelism, -m.p95_ms))
+
+
+def calibrate(
+    target_ms: float,
+    memory_costs: tuple[int, ...],
+    time_costs: tuple[int, ...],
+    parallelisms: tuple[int, ...],
+    samples: int,
+) -> list[Measurement]:
+    measurements = []
+    grid = itertools.product(memory_costs, time_costs, parallelisms)
+    for memory_cost, time_cost, parallelism in grid:
+        result = measure(memory_cost, time_cost, parallelism, samples)
+        measurements.append(result)
+        print(
+            f"m={memory_cost:>7} t={time_cost} p={parallelism} "
+            f"p50={result.p50_ms:7.1f}ms p95={result.p95_ms:7.1f}ms"
+            + ("" if result.p95_ms <= target_ms else "  (acima)"),
+            file=sys.stderr,
+        )
+    return measurements
+
+
+def _int_list(value: str) -> tuple[int, ...]:
+    return tuple(int(item) for item in value.split(",") if item)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--target-ms", type=float, default=50.0, help="orçamento do p95"
+    )
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument(
+        "--memory",
+        type=_int_list,
+        default=DEFAULT_MEMORY_COSTS,
+        help="custos de memória em KiB, separados por vírgula",
+    )
+    parser.add_argument("--time", type=_int_list, default=DEFAULT_TIME_COSTS)
+    parser.add_argument(
+        "--parallelism", type=_int_list, default=DEFAULT_PARALLELISMS
+    )
+    args = parser.parse_args()
+
+    measurements = calibrate(
+        args.target_ms,
+        args.memory,
+        args.time,
+        args.parallelism,
+        args.samples,
+    )
+    best = recommend(measurements, args.target_ms)
+    if best is None:
+        print(
+            f"Nenhuma combinação cabe em {args.target_ms:g} ms de p95.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    print(
+        f"# p95={best.p95_ms:.1f}ms (orçamento {args.target_ms:g}ms)\n"
+        + best.as_env()
+    )
+
+
+if __name__ == "__main__":
+    main()
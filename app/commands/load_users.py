@@ -0,0 +1,242 @@
+"""
+Carga offline de usuários no PostgreSQL via COPY.
+
+Lê CSV (colunas name,email,password) ou NDJSON, valida o email com o
+Value Object `Email`, aceita senhas já em `$argon2...` (se o hash for
+reconhecido) ou gera o hash das senhas em texto plano, e carrega em blocos com
+`copy_records_to_table` em uma tabela temporária, seguida de
+INSERT ... SELECT ... ON CONFLICT (email) DO NOTHING.
+
+Uso:
+    uv run python -m app.commands.load_users users.csv
+    uv run python -m app.commands.load_users users.ndjson --rejects out.ndjson
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import asyncpg
+from pydantic import ValidationError
+
+from app.settings import Settings
+from app.value_objects.data_time_sp import tz_sp_now
+from app.value_objects.email_vo import Email
+from app.value_objects.password import (
+    PASSWORD_MAX_LENGTH,
+    Password,
+    is_supported_hash,
+)
+from infrastructure.password_hasher import password_hasher
+
+COLUMNS = ("name", "email", "password", "created_at", "updated_at")
+STAGING_TABLE = "users_import_staging"
+
+
+@dataclass
+class Rejection:
+    line: int
+    reason: str
+
+
+@dataclass
+class LoadReport:
+    read: int = 0
+    inserted: int = 0
+    conflicts: int = 0  # já existiam no banco (também em `rejections`)
+    rejections: list[Rejection] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.read / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class ValidRow:
+    line: int
+    name: str
+    email: str
+    password: str
+    needs_hash: bool
+
+
+def iter_source_rows(path: Path) -> Iterator[tuple[int, dict]]:
+    """Lê o arquivo (CSV ou NDJSON, pela extensão) linha a linha."""
+    with path.open(encoding="utf-8", newline="") as source:
+        if path.suffix.lower() == ".csv":
+            # Linha 1 é o cabeçalho
+            for line, row in enumerate(csv.DictReader(source), start=2):
+                yield line, row
+            return
+
+        for line, raw in enumerate(source, start=1):
+            if not raw.strip():
+                continue
+            try:
+                row = json.loads(raw)
+            except ValueError:
+                row = None
+            yield line, row if isinstance(row, dict) else {}
+
+
+def validate_row(line: int, row: dict) -> ValidRow:
+    """Valida um registro; levanta `ValueError` com o motivo da rejeição."""
+    # NDJSON aceita qualquer tipo JSON e CSV sem a coluna traz None: os
+    # Value Objects recusam o que não for texto. Valores maiores que as
+    # colunas fariam o COPY falhar no meio da carga.
+    name = row.get("name")
+    if not isinstance(name, str) or not (name := name.strip()):
+        raise ValueError("invalid name")
+    if len(name) > 100:
+        raise ValueError("invalid name")
+
+    try:
+        email = Email(row.get("email")).root
+    except ValidationError:
+        raise ValueError("invalid email")
+
+    password = row.get("password")
+    needs_hash = not (
+        isinstance(password, str) and password.startswith("$argon2")
+    )
+    if needs_hash:
+        try:
+            Password(password)
+        except ValidationError:
+            raise ValueError("invalid password")
+    elif len(password) > PASSWORD_MAX_LENGTH or not is_supported_hash(
+        password
+    ):
+        raise ValueError("invalid password hash")
+
+    return ValidRow(line, name, email, password, needs_hash)
+
+
+def iter_chunks(
+    rows: Iterator[tuple[int, dict]], chunk_size: int, report: LoadReport
+) -> Iterator[list[ValidRow]]:
+    """Agrupa os registros válidos, descartando emails repetidos no arquivo."""
+    seen: set[str] = set()
+    chunk: list[ValidRow] = []
+
+    for line, row in rows:
+        report.read += 1
+        try:
+            valid = validate_row(line, row)
+        except ValueError as e:
+            report.rejections.append(Rejection(line, str(e)))
+            continue
+
+        if valid.email in seen:
+            report.rejections.append(Rejection(line, "duplicate email"))
+            continue
+        seen.add(valid.email)
+
+        chunk.append(valid)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+async def build_records(chunk: list[ValidRow]) -> list[tuple]:
+    """Gera os hashes pendentes em paralelo e monta as tuplas do COPY."""
+    to_hash = [row for row in chunk if row.needs_hash]
+    hashes = await password_hasher.hash_many([r.password for r in to_hash])
+    for row, hashed in zip(to_hash, hashes):
+        row.password = hashed
+
+    now = tz_sp_now()
+    return [(row.name, row.email, row.password, now, now) for row in chunk]
+
+
+async def copy_chunk(
+    conn: asyncpg.Connection, records: list[tuple]
+) -> set[str]:
+    """Carrega um bloco e retorna os emails efetivamente inseridos."""
+    async with conn.transaction():
+        await conn.copy_records_to_table(
+            STAGING_TABLE, records=records, columns=COLUMNS
+        )
+        inserted = await conn.fetch(
+            f"INSERT INTO users ({', '.join(COLUMNS)}) "
+            f"SELECT {', '.join(COLUMNS)} FROM {STAGING_TABLE} "
+            "ON CONFLICT (email) DO NOTHING RETURNING email"
+        )
+        await conn.execute(f"TRUNCATE {STAGING_TABLE}")
+    return {row["email"] for row in inserted}
+
+
+async def load_users(dsn: str, path: Path, chunk_size: int) -> LoadReport:
+    report = LoadReport()
+    start = time.perf_counter()
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        # Sem a coluna `id`: a sequence só é consumida no INSERT final
+        await conn.execute(
+            f"CREATE TEMP TABLE {STAGING_TABLE} ("
+            "name VARCHAR(100), email VARCHAR(255), password VARCHAR(255), "
+            "created_at TIMESTAMPTZ, updated_at TIMESTAMPTZ)"
+        )
+        for chunk in iter_chunks(iter_source_rows(path), chunk_size, report):
+            inserted = await copy_chunk(conn, await build_records(chunk))
+            report.inserted += len(inserted)
+            for row in chunk:
+                if row.email not in inserted:
+                    report.conflicts += 1
+                    report.rejections.append(
+                        Rejection(row.line, "email already registered")
+                    )
+            report.elapsed = time.perf_counter() - start
+            print(
+                f"{report.read} lidas, {report.inserted} inseridas "
+                f"({report.rows_per_sec:,.0f} linhas/s)",
+                file=sys.stderr,
+            )
+    finally:
+        await conn.close()
+        password_hasher.shutdown()
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", type=Path, help="arquivo .csv ou .ndjson")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument(
+        "--rejects", type=Path, help="grava as linhas rejeitadas (NDJSON)"
+    )
+    args = parser.parse_args()
+
+    # asyncpg não entende o prefixo de driver do SQLAlchemy
+    dsn = Settings().DATABASE_URL.replace("postgresql+asyncpg", "postgresql")
+    report = asyncio.run(load_users(dsn, args.path, args.chunk_size))
+
+    if args.rejects:
+        with args.rejects.open("w", encoding="utf-8") as out:
+            for rejection in report.rejections:
+                out.write(json.dumps(rejection.__dict__) + "\n")
+
+    print(
+        f"lidas={report.read} inseridas={report.inserted} "
+        f"ja_existentes={report.conflicts} "
+        f"rejeitadas={len(report.rejections)} "
+        f"tempo={report.elapsed:.1f}s "
+        f"taxa={report.rows_per_sec:,.0f} linhas/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
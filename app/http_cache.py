@@ -0,0 +1,125 @@
+"""
+Cache HTTP para leituras de usuário.
+
+- Requisições condicionais (ETag / Last-Modified): a versão de um usuário
+  é o par `id` + `updated_at` (atualizado por `User.touch()`), em
+  microssegundos desde a época para caber também nas claims do token.
+- Cache de respostas de `GET /users/` no processo (opcional), invalidado
+  pelas escritas deste worker e limitado por TTL nos demais.
+"""
+
+import datetime
+from dataclasses import dataclass
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+from app.settings import Settings
+from infrastructure.cache import TTLCache
+
+settings = Settings()
+
+# Resposta é específica do usuário e deve ser sempre revalidada
+CACHE_CONTROL = "private, no-cache"
+
+
+def epoch_us(value: datetime.datetime) -> int:
+    """
+    Converte `updated_at` para microssegundos desde a época. Datas sem
+    fuso (SQLite) são tratadas como UTC, de forma consistente entre
+    leituras.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.UTC)
+    delta = value - datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+    return delta // datetime.timedelta(microseconds=1)
+
+
+def weak_etag(user_id: int, updated_at_us: int) -> str:
+    return f'W/"{user_id}-{updated_at_us:x}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # Comparação fraca: ignora o prefixo W/ dos dois lados
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified_since(if_modified_since: str, last_modified_us: int) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except TypeError, ValueError:
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=datetime.UTC)
+    # Last-Modified tem resolução de segundos
+    return last_modified_us // 1_000_000 <= int(since.timestamp())
+
+
+def conditional_response(
+    request: Request, user_id: int, updated_at_us: int | None
+) -> tuple[Response | None, dict[str, str]]:
+    """
+    Calcula os cabeçalhos de validação e, se o cliente já tem a versão
+    atual, a resposta 304 (sem corpo) a ser devolvida no lugar.
+
+    `If-None-Match` tem precedência sobre `If-Modified-Since` (RFC 9110).
+    Sem `updated_at` (tokens antigos), não há validação condicional.
+    """
+    if updated_at_us is None:
+        return None, {}
+
+    etag = weak_etag(user_id, updated_at_us)
+    last_modified = datetime.datetime.fromtimestamp(
+        updated_at_us // 1_000_000, tz=datetime.UTC
+    )
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        not_modified = if_modified_since is not None and _not_modified_since(
+            if_modified_since, updated_at_us
+        )
+
+    if not_modified:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+        ), headers
+    return None, headers
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """Resposta já serializada; `updated_at_us` é None para o 404."""
+
+    status_code: int
+    body: bytes
+    user_id: int | None = None
+    updated_at_us: int | None = None
+
+
+# Respostas de GET /users/ indexadas pelo email normalizado
+user_response_cache: TTLCache[str, CachedResponse] = TTLCache(
+    ttl=settings.USER_RESPONSE_CACHE_TTL_SECONDS,
+    maxsize=settings.USER_RESPONSE_CACHE_MAXSIZE,
+    maxbytes=settings.USER_RESPONSE_CACHE_MAX_BYTES,
+    weigh=lambda response: len(response.body),
+)
+
+
+def invalidate_user_responses(*emails: str) -> None:
+    """Remove respostas (inclusive 404) de emails criados/alterados."""
+    for email in emails:
+        user_response_cache.pop(email)
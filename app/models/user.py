@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import datetime
-from sqlalchemy import DateTime, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column
+
+from sqlalchemy import DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, make_transient_to_detached, mapped_column
 
 from app.models import table_registry
 from app.value_objects.data_time_sp import tz_sp_now
@@ -15,6 +16,21 @@ from app.value_objects.password import Password, PasswordType
 @table_registry.mapped_as_dataclass
 class User:
     __tablename__ = "users"
+    __table_args__ = (
+        # Paginação por keyset (GET /users/list) ordenada por data
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # Filtros por prefixo (LIKE 'abc%') em colações não-C do PostgreSQL
+        Index(
+            "ix_users_name_pattern",
+            "name",
+            postgresql_ops={"name": "varchar_pattern_ops"},
+        ),
+        Index(
+            "ix_users_email_pattern",
+            "email",
+            postgresql_ops={"email": "varchar_pattern_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, autoincrement=True, init=False
@@ -46,14 +62,37 @@ class User:
     def create(
         cls,
         name: str,
-        email: str,
-        password: str,
+        email: Email | str,
+        password: Password | str,
     ) -> User:
+        # Value Objects já validados (schemas de entrada) não são revalidados
         return cls(
             name=name,
-            email=Email(email),
-            password=Password(password),
+            email=email if isinstance(email, Email) else Email(email),
+            password=(
+                password
+                if isinstance(password, Password)
+                else Password(password)
+            ),
+        )
+
+    @classmethod
+    def detached_from(cls, source) -> User:
+        """
+        Cópia desanexada (fora de qualquer sessão) de um `User` ou de uma
+        linha com todas as colunas. Pode ser compartilhada entre
+        requisições: rollback ou expiração de uma sessão não a afetam, e
+        `session.merge(user, load=False)` a copia para a sessão atual.
+        """
+        user = cls(
+            name=source.name, email=source.email, password=source.password
         )
+        user.id = source.id
+        user.created_at = source.created_at
+        user.updated_at = source.updated_at
+        # Sem histórico pendente, como se tivesse acabado de ser carregado
+        make_transient_to_detached(user)
+        return user
 
     def validar_senha(self, input_password: str) -> bool:
         # Atualizado para usar o método verify_password do pwdlib
@@ -62,7 +101,7 @@ class User:
     def patch_user(
         self,
         name: str | None = None,
-        new_email: str | None = None,
+        new_email: Email | str | None = None,
         password: str | None = None,
     ) -> None:
         """Atualiza os atributos da instância se os valores forem fornecidos."""
@@ -77,8 +116,8 @@ class User:
 
         self.touch()
 
-    def update_email(self, email: str) -> None:
-        self.email = Email(email)
+    def update_email(self, email: Email | str) -> None:
+        self.email = email if isinstance(email, Email) else Email(email)
         self.touch()
 
     def touch(self) -> None:
@@ -1,6 +1,32 @@
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.models.user import User
+from app.settings import Settings
+from app.value_objects.password import Password
+from infrastructure.singleflight import SingleFlight
+
+settings = Settings()
+
+# Buscas idênticas e simultâneas no mesmo worker compartilham uma única
+# consulta. Só linhas (`Row`, imutáveis) são compartilhadas, nunca
+# entidades presas à sessão de quem executou a consulta.
+user_lookups = SingleFlight()
+
+USER_COLUMNS = (
+    User.id,
+    User.name,
+    User.email,
+    User.password,
+    User.created_at,
+    User.updated_at,
+)
+
+
+async def _coalesced(key: tuple, query):
+    if not settings.USER_LOOKUP_COALESCING_ENABLED:
+        return await query()
+    return await user_lookups.do(key, query)
 
 
 async def get_user_by_email_repo(
@@ -9,5 +35,47 @@ async def get_user_by_email_repo(
     """
     Busca usuário pelo email retornando None se não existir.
     Utilizado para processos internos como autenticação.
+
+    Cada chamador recebe a própria instância, desanexada: rotas de
+    escrita usam `session.merge(user, load=False)` antes de alterá-la.
     """
-    return await session.scalar(select(User).where(User.email == email))
+
+    async def query():
+        result = await session.execute(
+            select(*USER_COLUMNS).where(User.email == email)
+        )
+        return result.first()
+
+    row = await _coalesced(("entity", email), query)
+    return None if row is None else User.detached_from(row)
+
+
+async def get_user_public_by_email_repo(session: AsyncSession, email: str):
+    """
+    Busca apenas id, nome, email e `updated_at` (sem a senha), para fluxos
+    que só precisam das claims do usuário, como a renovação do access
+    token, ou da versão para requisições condicionais.
+    """
+
+    async def query():
+        result = await session.execute(
+            select(User.id, User.name, User.email, User.updated_at).where(
+                User.email == email
+            )
+        )
+        return result.first()
+
+    return await _coalesced(("public", email), query)
+
+
+async def update_password_hash_repo(
+    session: AsyncSession, user_id: int, hashed_password: str
+) -> None:
+    """Grava um novo hash de senha (rehash após mudança de parâmetros)."""
+    await session.execute(
+        update(User)
+        .where(User.id == user_id)
+        # VO mantém o objeto no identity map consistente após o UPDATE
+        .values(password=Password(hashed_password))
+    )
+    await session.commit()
@@ -1,54 +1,162 @@
+import base64
+import binascii
+import datetime
+import json
+from collections.abc import AsyncGenerator
 from http import HTTPStatus
+from typing import Literal
+
 from fastapi import HTTPException
 from pydantic import ValidationError
-
-from sqlalchemy import select
+from sqlalchemy import Row, String, select, tuple_, type_coerce
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.http_cache import invalidate_user_responses
 from app.models.user import User
+from app.repositories.authenticate import get_user_public_by_email_repo
 from app.schemas.user_schemas import (
+    BulkUserResult,
+    GetByEmail,
     UserCreate,
-    UserPublic,
     UserPatch,
-    GetByEmail,
+    UserPublic,
 )
+from app.security import invalidate_cached_user
+from app.value_objects.email_vo import Email
+from app.value_objects.password import Password
+from infrastructure.db_context import dialect_insert
+from infrastructure.password_hasher import password_hasher
+
+# Colunas servidas por `UserPublic`. Consultas de leitura selecionam só
+# estas colunas: a senha não é lida nem vira um Value Object `Password`.
+PUBLIC_COLUMNS = (User.id, User.name, User.email)
 
 
 async def create_user_repo(
     user_input: UserCreate, session: AsyncSession
 ) -> UserPublic:
-    """Cria um novo usuário."""
+    """
+    Cria um novo usuário com um único INSERT ... ON CONFLICT (email)
+    DO NOTHING RETURNING: sem SELECT prévio nem refresh, e sem janela de
+    corrida entre a verificação e a inserção.
+    """
+    new_user = User.create(
+        name=user_input.name,
+        email=user_input.email,
+        password=user_input.password,
+    )
 
-    async with session.begin():
-        verify_existence = await session.scalar(
-            select(User).where(User.email == user_input.email)
+    # O hash roda no pool, fora do event loop (não no TypeDecorator)
+    new_user.password = Password(
+        await password_hasher.hash(user_input.password.root.get_secret_value())
+    )
+
+    insert = dialect_insert(session)
+    stmt = (
+        insert(User)
+        .values(
+            name=new_user.name,
+            email=new_user.email,
+            password=new_user.password,
+            created_at=new_user.created_at,
+            updated_at=new_user.updated_at,
         )
-        if verify_existence:
-            raise HTTPException(
-                status_code=HTTPStatus.BAD_REQUEST,
-                detail="Email already registered.",
-            )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(*PUBLIC_COLUMNS)
+    )
 
+    created_user = (await session.execute(stmt)).first()
+    await session.commit()
+
+    # Nenhuma linha retornada: o email já existia
+    if created_user is None:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail="Email already registered.",
+        )
+
+    # Descarta um eventual 404 em cache para este email
+    invalidate_user_responses(created_user.email.root)
+    return created_user
+
+
+async def bulk_create_users_repo(
+    users_input: list[tuple[int, UserCreate]],
+    session: AsyncSession,
+) -> list[BulkUserResult]:
+    """
+    Cria um lote de usuários já validados: descarta emails repetidos no
+    lote, gera os hashes em paralelo e insere com um único INSERT
+    multi-linha ON CONFLICT (email) DO NOTHING RETURNING. Devolve um
+    resultado por item, na ordem de entrada.
+    """
+    results: dict[int, BulkUserResult] = {}
+    # email normalizado -> (índice, usuário, senha em texto)
+    pending: dict[str, tuple[int, User, str]] = {}
+
+    for index, user_input in users_input:
+        email = user_input.email.root
+        if email in pending:
+            # Repetido dentro do próprio lote: não gasta hash à toa
+            results[index] = BulkUserResult(
+                index=index, status="conflict", email=email
+            )
+            continue
         new_user = User.create(
             name=user_input.name,
             email=user_input.email,
             password=user_input.password,
         )
+        pending[email] = (
+            index,
+            new_user,
+            user_input.password.root.get_secret_value(),
+        )
 
-        session.add(new_user)
+    if pending:
+        hashes = await password_hasher.hash_many([
+            plain for _, _, plain in pending.values()
+        ])
+        insert = dialect_insert(session)
+        stmt = (
+            insert(User)
+            .values([
+                {
+                    "name": new_user.name,
+                    "email": new_user.email,
+                    "password": hashed,
+                    "created_at": new_user.created_at,
+                    "updated_at": new_user.updated_at,
+                }
+                for (_, new_user, _), hashed in zip(pending.values(), hashes)
+            ])
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.id, User.email)
+        )
+        created = {
+            row.email.root: row.id for row in await session.execute(stmt)
+        }
+        await session.commit()
+        invalidate_user_responses(*created)
 
-    await session.refresh(new_user)
+        for email, (index, _, _) in pending.items():
+            results[index] = BulkUserResult(
+                index=index,
+                status="created" if email in created else "conflict",
+                id=created.get(email),
+                email=email,
+            )
 
-    return new_user
+    return [results[index] for index in sorted(results)]
 
 
 async def get_user_by_email_repo(
     user_input: GetByEmail, session: AsyncSession
 ) -> UserPublic:
-    """Recupera um usuário pelo email."""
+    """Recupera um usuário pelo email (apenas as colunas públicas)."""
     try:
-        result = await session.scalar(
-            select(User).where(User.email == user_input.email)
+        result = await get_user_public_by_email_repo(
+            session, user_input.email.root
         )
 
         if not result:
@@ -57,6 +165,9 @@ async def get_user_by_email_repo(
             )
         return result
 
+    except HTTPException:
+        raise
+
     except Exception as e:
         raise HTTPException(
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
@@ -64,6 +175,113 @@ async def get_user_by_email_repo(
         )
 
 
+async def get_users_by_emails_repo(
+    emails: list[Email], session: AsyncSession
+) -> dict[str, Row]:
+    """
+    Resolve vários emails (já normalizados) com uma única consulta
+    `WHERE email IN (...)`. Retorna as colunas públicas indexadas pelo
+    email; emails ausentes simplesmente não aparecem.
+    """
+    unique = list({email.root: email for email in emails}.values())
+    if not unique:
+        return {}
+
+    result = await session.execute(
+        select(*PUBLIC_COLUMNS).where(User.email.in_(unique))
+    )
+    return {row.email.root: row for row in result}
+
+
+async def stream_users_repo(
+    session: AsyncSession, batch_size: int
+) -> AsyncGenerator[list[Row]]:
+    """
+    Percorre a tabela inteira com um cursor do lado do servidor, em lotes
+    de `batch_size` linhas: a memória não depende do tamanho da tabela.
+    """
+    result = await session.stream(
+        select(*PUBLIC_COLUMNS)
+        .order_by(User.id)
+        .execution_options(yield_per=batch_size)
+    )
+    async for partition in result.partitions():
+        yield partition
+
+
+def encode_cursor(sort_by: str, row: Row) -> str:
+    """Cursor opaco com a chave de ordenação da última linha da página."""
+    key = row.created_at.isoformat() if sort_by == "created_at" else row.id
+    raw = json.dumps({"s": sort_by, "k": key, "id": row.id})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(sort_by: str, cursor: str) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        if data["s"] != sort_by:
+            raise ValueError("cursor from another ordering")
+        if sort_by == "created_at":
+            return (
+                datetime.datetime.fromisoformat(data["k"]),
+                int(data["id"]),
+            )
+        return (int(data["id"]),)
+    except ValueError, KeyError, TypeError, binascii.Error:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail="Invalid cursor."
+        )
+
+
+async def list_users_repo(
+    session: AsyncSession,
+    *,
+    limit: int,
+    sort_by: Literal["id", "created_at"] = "id",
+    order: Literal["asc", "desc"] = "asc",
+    cursor: str | None = None,
+    name_prefix: str | None = None,
+    email_prefix: str | None = None,
+) -> tuple[list[Row], str | None]:
+    """
+    Lista usuários com paginação por keyset: a página seguinte parte da
+    chave da última linha (`WHERE (created_at, id) > ...`), sem OFFSET,
+    então o custo depende só do tamanho da página.
+    """
+    keys = (
+        (User.created_at, User.id) if sort_by == "created_at" else (User.id,)
+    )
+    stmt = select(*PUBLIC_COLUMNS, User.created_at)
+
+    if name_prefix:
+        stmt = stmt.where(User.name.startswith(name_prefix, autoescape=True))
+    if email_prefix:
+        # Compara como texto: o prefixo não é um email completo
+        stmt = stmt.where(
+            type_coerce(User.email, String).startswith(
+                email_prefix.lower(), autoescape=True
+            )
+        )
+
+    if cursor is not None:
+        after = decode_cursor(sort_by, cursor)
+        stmt = stmt.where(
+            tuple_(*keys) > after if order == "asc" else tuple_(*keys) < after
+        )
+
+    stmt = stmt.order_by(
+        *(key.asc() if order == "asc" else key.desc() for key in keys)
+    ).limit(limit + 1)  # uma linha a mais indica se há próxima página
+
+    rows = list((await session.execute(stmt)).all())
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = encode_cursor(sort_by, rows[-1]) if has_next else None
+    return rows, next_cursor
+
+
 async def patch_user_repo(
     user_input: UserPatch,
     current_user: User,
@@ -71,11 +289,13 @@ async def patch_user_repo(
 ) -> User:
     """Edita um usuário existente."""
 
+    # O usuário pode vir do cache de autenticação (desanexado de outra
+    # sessão); trazemos uma cópia para a sessão atual sem ir ao banco.
+    current_user = await session.merge(current_user, load=False)
+    old_email = current_user.email.root
+
     # 1. Verifica duplicidade de e-mail se houve alteração
-    if (
-        user_input.new_email
-        and user_input.new_email != current_user.email.root
-    ):
+    if user_input.new_email and user_input.new_email != current_user.email:
         email_exists = await session.scalar(
             select(User).where(User.email == user_input.new_email)
         )
@@ -86,17 +306,28 @@ async def patch_user_repo(
             )
 
     try:
-        # 2. Aplica as alterações (Isso dispara a validação do Password/Email)
+        # 2. Gera o hash da nova senha (já validada no schema) no pool,
+        # fora do event loop
+        hashed_password = None
+        if user_input.password is not None:
+            hashed_password = await password_hasher.hash(
+                user_input.password.root.get_secret_value()
+            )
+
+        # 3. Aplica as alterações
         current_user.patch_user(
             name=user_input.name,
             new_email=user_input.new_email,
-            password=user_input.password,
+            password=hashed_password,
         )
 
         session.add(current_user)
         await session.commit()
         await session.refresh(current_user)
 
+        invalidate_cached_user(old_email, current_user.email.root)
+        invalidate_user_responses(old_email, current_user.email.root)
+
         return current_user
 
     except ValidationError as e:
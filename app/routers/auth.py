@@ -3,25 +3,33 @@ from typing import Annotated
 
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
+    Depends,
     HTTPException,
+    Request,
     Response,
     status,
-    Depends,
-    Request,
 )
+from jwt.exceptions import DecodeError, PyJWTError
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-import jwt
-from jwt.exceptions import PyJWTError, DecodeError
 
+from app.http_cache import epoch_us
 from app.models.user import User
-from app.repositories.authenticate import get_user_by_email_repo
+from app.repositories.authenticate import get_user_public_by_email_repo
 from app.schemas.authenticate_schemas import Login
+from app.schemas.responses import UserPublicResponse
 from app.schemas.user_schemas import UserPublic
-from app.security import get_current_user
+from app.security import (
+    check_login_rate_limit,
+    get_current_user,
+    login_admission,
+)
 from app.services.authenticate import (
     authenticate_user_service,
     create_access_token_service,
     create_refresh_token_service,
+    decode_token_service,
 )
 from app.settings import Settings
 from infrastructure.db_context import get_session
@@ -36,28 +44,22 @@ router = APIRouter(
 settings: Settings = Settings()
 
 
-@router.post("/", response_model=UserPublic)
-async def login(session: T_Session, user_login: Login, response: Response):
-    user = await authenticate_user_service(
-        session, user_login.email.root, user_login.password
-    )
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
+def set_access_token_cookie(response: Response, user: User | Row) -> None:
+    """Emite um novo access token com as claims atuais do usuário."""
     access_token_expires = timedelta(
         minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
     access_token = create_access_token_service(
-        data={"sub": user.email.root, "id": user.id, "name": user.name},
+        data={
+            "sub": user.email.root,
+            "id": user.id,
+            "name": user.name,
+            # Permite responder 304 em /users/me sem consultar o banco
+            "updated_at": epoch_us(user.updated_at),
+        },
         expires_delta=access_token_expires,
     )
 
-    refresh_token = create_refresh_token_service(data={"sub": user.email.root})
-
     response.set_cookie(
         key="access_token",
         value=f"Bearer {access_token}",
@@ -69,6 +71,38 @@ async def login(session: T_Session, user_login: Login, response: Response):
         samesite=settings.AUTH_COOKIE_SAMESITE,
     )
 
+
+@router.post("/", response_model=UserPublic)
+async def login(
+    session: T_Session,
+    user_login: Login,
+    request: Request,
+    background_tasks: BackgroundTasks,
+):
+    check_login_rate_limit(request, user_login.email.root)
+
+    # Eventual rehash da senha é gravado após a resposta, ainda com a
+    # sessão da requisição aberta (as dependências com yield encerram
+    # depois das background tasks).
+    with login_admission():
+        user = await authenticate_user_service(
+            session,
+            user_login.email.root,
+            user_login.password,
+            background_tasks,
+        )
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    response = UserPublicResponse(user)
+    set_access_token_cookie(response, user)
+
+    refresh_token = create_refresh_token_service(data={"sub": user.email.root})
+
     response.set_cookie(
         key="refresh_token",
         value=refresh_token,
@@ -80,11 +114,13 @@ async def login(session: T_Session, user_login: Login, response: Response):
         samesite=settings.AUTH_COOKIE_SAMESITE,
     )
 
-    return user
+    return response
 
 
 @router.post("/refresh")
-async def refresh_access_token(session: T_Session, request: Request, response: Response):
+async def refresh_access_token(
+    session: T_Session, request: Request, response: Response
+):
     refresh_token = request.cookies.get("refresh_token")
     if not refresh_token:
         raise HTTPException(
@@ -93,9 +129,7 @@ async def refresh_access_token(session: T_Session, request: Request, response: R
         )
 
     try:
-        payload = jwt.decode(
-            refresh_token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = decode_token_service(refresh_token)
         email: str = payload.get("sub")
         token_type: str = payload.get("type")
 
@@ -105,39 +139,21 @@ async def refresh_access_token(session: T_Session, request: Request, response: R
                 detail="Invalid refresh token",
             )
 
-        user = await get_user_by_email_repo(session, email)
+        user = await get_user_public_by_email_repo(session, email)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found",
             )
 
-    except (PyJWTError, DecodeError):
+    except PyJWTError, DecodeError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token",
         )
 
     # Gera novo access token
-    access_token_expires = timedelta(
-        minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
-
-    new_access_token = create_access_token_service(
-        data={"sub": user.email.root, "id": user.id, "name": user.name},
-        expires_delta=access_token_expires,
-    )
-
-    response.set_cookie(
-        key="access_token",
-        value=f"Bearer {new_access_token}",
-        httponly=True,
-        # O cookie espera o tempo em segundos, mas nossa config está em minutos
-        max_age=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        expires=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        secure=settings.AUTH_COOKIE_SECURE,
-        samesite=settings.AUTH_COOKIE_SAMESITE,
-    )
+    set_access_token_cookie(response, user)
 
     return {"message": "Access token refreshed"}
 
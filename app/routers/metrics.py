@@ -0,0 +1,31 @@
+from fastapi import APIRouter
+
+from app.http_cache import user_response_cache
+from app.repositories.authenticate import user_lookups
+from app.security import (
+    login_concurrency,
+    login_email_limiter,
+    login_ip_limiter,
+)
+from infrastructure.db_context import health_checker, pool_metrics
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"],
+)
+
+
+@router.get("/")
+async def read_metrics():
+    """Métricas em memória do worker atual, para ajuste fino do pool."""
+    return {
+        "db_pool": pool_metrics.snapshot(),
+        "db_health": health_checker.stats(),
+        "user_lookups": user_lookups.stats(),
+        "user_response_cache": user_response_cache.stats(),
+        "login_limits": {
+            "per_ip": login_ip_limiter.stats(),
+            "per_email": login_email_limiter.stats(),
+            "concurrency": login_concurrency.stats(),
+        },
+    }
@@ -1,29 +1,74 @@
+import json
+from collections.abc import AsyncIterator
 from http import HTTPStatus
-from typing import Annotated
+from typing import Annotated, Literal
 
+import anyio
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.http_cache import (
+    CachedResponse,
+    conditional_response,
+    epoch_us,
+    invalidate_user_responses,
+    user_response_cache,
+)
 from app.models.user import User
+from app.repositories.user import (
+    bulk_create_users_repo,
+    create_user_repo,
+    get_user_by_email_repo,
+    get_users_by_emails_repo,
+    list_users_repo,
+    patch_user_repo,
+)
+from app.routers.auth import set_access_token_cookie
+from app.schemas.responses import (
+    UserPublicResponse,
+    dump_user_page,
+    dump_user_public,
+)
 from app.schemas.user_schemas import (
-    UserCreate,
+    BulkUserResult,
+    DeleteUser,
     GetByEmail,
+    UserCreate,
+    UserLookup,
+    UserLookupResult,
+    UserPage,
     UserPatch,
     UserPublic,
-    DeleteUser,
 )
-from app.repositories.user import (
-    create_user_repo,
-    get_user_by_email_repo,
-    patch_user_repo,
+from app.security import (
+    Principal,
+    get_current_admin,
+    get_current_claims,
+    get_current_user,
+    invalidate_cached_user,
+)
+from app.services.user_export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    export_users_service,
 )
-from fastapi import Depends, status, Response, APIRouter
-
-from app.security import get_current_user
 from app.settings import Settings
-
+from app.value_objects.email_vo import Email
 from infrastructure.db_context import get_session
 
 T_CurrentUser = Annotated[User, Depends(get_current_user)]
+T_CurrentClaims = Annotated[Principal, Depends(get_current_claims)]
+T_CurrentAdmin = Annotated[Principal, Depends(get_current_admin)]
 T_Session = Annotated[AsyncSession, Depends(get_session)]
 router = APIRouter(
     prefix="/users",
@@ -34,12 +79,324 @@ settings = Settings()
 
 @router.post("/", status_code=HTTPStatus.CREATED, response_model=UserPublic)
 async def create_user(user: UserCreate, session: T_Session):
-    return await create_user_repo(user, session)
+    return UserPublicResponse(
+        await create_user_repo(user, session), status_code=HTTPStatus.CREATED
+    )
+
+
+async def _iter_ndjson_lines(request: Request) -> AsyncIterator[bytes]:
+    """Lê o corpo NDJSON em streaming, uma linha não vazia por vez."""
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
+BulkItem = tuple[int, UserCreate | BulkUserResult]
+
+
+def _parse_bulk_item(index: int, parse, raw) -> BulkItem:
+    """`UserCreate` do item ou, se falhar no schema, o resultado `invalid`."""
+    try:
+        return index, parse(raw)
+    except ValidationError as e:
+        return index, BulkUserResult(
+            index=index,
+            status="invalid",
+            errors=e.errors(include_url=False, include_context=False),
+        )
+
+
+async def _iter_ndjson_items(request: Request) -> AsyncIterator[BulkItem]:
+    """
+    Itens NDJSON conforme as linhas chegam. Como a resposta já começou,
+    o limite de itens vira um último resultado `invalid` (não um 413).
+    """
+    index = 0
+    async for line in _iter_ndjson_lines(request):
+        if index >= settings.USER_BULK_MAX_ITEMS:
+            yield (
+                index,
+                BulkUserResult(
+                    index=index,
+                    status="invalid",
+                    errors=[
+                        {
+                            "type": "too_many_items",
+                            "loc": [],
+                            "msg": f"At most {settings.USER_BULK_MAX_ITEMS} users.",
+                        }
+                    ],
+                ),
+            )
+            return
+        yield _parse_bulk_item(index, UserCreate.model_validate_json, line)
+        index += 1
+
+
+async def _read_json_items(request: Request) -> AsyncIterator[BulkItem]:
+    """
+    Array JSON: precisa do corpo inteiro para ser decodificado, então o
+    formato e o limite de itens são verificados antes da resposta.
+    """
+    try:
+        items = json.loads(await request.body())
+    except ValueError:
+        items = None
+    if not isinstance(items, list):
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail="Expected a JSON array or an NDJSON stream of users.",
+        )
+    if len(items) > settings.USER_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.USER_BULK_MAX_ITEMS} users.",
+        )
+
+    async def _items() -> AsyncIterator[BulkItem]:
+        for index, item in enumerate(items):
+            yield _parse_bulk_item(index, UserCreate.model_validate, item)
+
+    return _items()
+
+
+class _BodyStreamingResponse(StreamingResponse):
+    """
+    `StreamingResponse` que ainda lê o corpo da requisição enquanto
+    responde. O Starlette (ASGI < 2.4, caso do uvicorn) escuta a
+    desconexão em paralelo chamando `receive`, o que consumiria pedaços
+    do corpo; aqui só o iterador lê, e `request.stream()` já levanta
+    `ClientDisconnect` se o cliente sair.
+    """
+
+    async def listen_for_disconnect(self, receive) -> None:
+        await anyio.sleep_forever()
+
+
+@router.post("/bulk", status_code=HTTPStatus.OK)
+async def bulk_create_users(
+    request: Request,
+    session: T_Session,
+    current_user: T_CurrentAdmin,
+):
+    """
+    Importação em lote, somente para administradores (`ADMIN_USER_IDS`).
+    Aceita um array JSON ou NDJSON (`application/x-ndjson`) e devolve um
+    resultado NDJSON por item.
+
+    Cada lote de `USER_BULK_BATCH_SIZE` itens é validado, inserido e
+    respondido (na ordem de entrada) antes de o próximo ser lido: com
+    NDJSON, memória e tempo até o primeiro resultado dependem só do lote.
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("application/x-ndjson"):
+        items = _iter_ndjson_items(request)
+    else:
+        items = await _read_json_items(request)
+
+    async def _results() -> AsyncIterator[str]:
+        batch: list[BulkItem] = []
+        async for item in items:
+            batch.append(item)
+            if len(batch) >= settings.USER_BULK_BATCH_SIZE:
+                for result in await _process_batch(batch, session):
+                    yield result.model_dump_json(exclude_none=True) + "\n"
+                batch = []
+        for result in await _process_batch(batch, session):
+            yield result.model_dump_json(exclude_none=True) + "\n"
+
+    return _BodyStreamingResponse(
+        _results(), media_type="application/x-ndjson"
+    )
+
+
+async def _process_batch(
+    batch: list[BulkItem], session: AsyncSession
+) -> list[BulkUserResult]:
+    results = [item for _, item in batch if isinstance(item, BulkUserResult)]
+    valid = [
+        (index, item) for index, item in batch if isinstance(item, UserCreate)
+    ]
+    if valid:
+        results += await bulk_create_users_repo(valid, session)
+    return sorted(results, key=lambda result: result.index)
 
 
 @router.get("/", status_code=HTTPStatus.OK, response_model=UserPublic)
-async def get_user_by_email(session: T_Session, user: GetByEmail = Depends()):
-    return await get_user_by_email_repo(user, session)
+async def get_user_by_email(
+    session: T_Session,
+    request: Request,
+    user: Annotated[GetByEmail, Query()],
+):
+    if not settings.USER_RESPONSE_CACHE_ENABLED:
+        row = await get_user_by_email_repo(user, session)
+
+        not_modified, headers = conditional_response(
+            request, row.id, epoch_us(row.updated_at)
+        )
+        if not_modified is not None:
+            return not_modified
+        return UserPublicResponse(row, headers=headers)
+
+    cached = await _cached_user_response(user, session)
+    not_modified, headers = conditional_response(
+        request, cached.user_id, cached.updated_at_us
+    )
+    if not_modified is not None:
+        return not_modified
+    return Response(
+        content=cached.body,
+        status_code=cached.status_code,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+async def _cached_user_response(
+    user: GetByEmail, session: AsyncSession
+) -> CachedResponse:
+    """Busca no cache de respostas ou consulta e serializa uma vez."""
+    key = user.email.root
+    cached = user_response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        row = await get_user_by_email_repo(user, session)
+    except HTTPException as e:
+        if e.status_code != HTTPStatus.NOT_FOUND:
+            raise
+        # Cache negativo: evita consultar o banco a cada polling
+        cached = CachedResponse(
+            status_code=e.status_code,
+            body=json.dumps({"detail": e.detail}).encode(),
+        )
+        user_response_cache.set(
+            key, cached, ttl=settings.USER_RESPONSE_CACHE_NEGATIVE_TTL_SECONDS
+        )
+        return cached
+
+    cached = CachedResponse(
+        status_code=HTTPStatus.OK,
+        body=dump_user_public(row),
+        user_id=row.id,
+        updated_at_us=epoch_us(row.updated_at),
+    )
+    user_response_cache.set(key, cached)
+    return cached
+
+
+@router.post(
+    "/lookup",
+    status_code=HTTPStatus.OK,
+    response_model=list[UserLookupResult],
+)
+async def lookup_users(
+    session: T_Session,
+    lookup: UserLookup,
+    current_user: T_CurrentClaims,
+):
+    """
+    Resolve vários emails em uma única consulta. A resposta segue a ordem
+    de entrada, com `not_found` para ausentes e `invalid` para emails
+    malformados.
+    """
+    if len(lookup.emails) > settings.USER_LOOKUP_MAX_EMAILS:
+        raise HTTPException(
+            status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.USER_LOOKUP_MAX_EMAILS} emails.",
+        )
+
+    normalized: list[Email | None] = []
+    for raw in lookup.emails:
+        try:
+            normalized.append(Email(raw))
+        except ValidationError:
+            normalized.append(None)
+
+    found = await get_users_by_emails_repo(
+        [email for email in normalized if email is not None], session
+    )
+
+    results = []
+    for raw, email in zip(lookup.emails, normalized):
+        if email is None:
+            results.append(UserLookupResult(email=raw, status="invalid"))
+        elif (row := found.get(email.root)) is None:
+            results.append(UserLookupResult(email=raw, status="not_found"))
+        else:
+            results.append(
+                UserLookupResult(
+                    email=raw,
+                    status="found",
+                    user=UserPublic.model_validate(row),
+                )
+            )
+    return results
+
+
+@router.get("/list", status_code=HTTPStatus.OK, response_model=UserPage)
+async def list_users(
+    session: T_Session,
+    current_user: T_CurrentAdmin,
+    sort_by: Literal["id", "created_at"] = "id",
+    order: Literal["asc", "desc"] = "asc",
+    cursor: str | None = None,
+    limit: Annotated[
+        int, Query(ge=1, le=settings.USER_LIST_MAX_PAGE_SIZE)
+    ] = settings.USER_LIST_PAGE_SIZE,
+    name_prefix: Annotated[str | None, Query(max_length=100)] = None,
+    email_prefix: Annotated[str | None, Query(max_length=255)] = None,
+):
+    """
+    Listagem paginada por cursor, somente para administradores. Para a
+    próxima página, repita a consulta com `cursor=next_cursor` (mesmos
+    `sort_by` e `order`).
+    """
+    items, next_cursor = await list_users_repo(
+        session,
+        limit=limit,
+        sort_by=sort_by,
+        order=order,
+        cursor=cursor,
+        name_prefix=name_prefix,
+        email_prefix=email_prefix,
+    )
+    return Response(
+        dump_user_page(items, next_cursor), media_type="application/json"
+    )
+
+
+@router.get("/export", status_code=HTTPStatus.OK)
+async def export_users(
+    session: T_Session,
+    current_user: T_CurrentAdmin,
+    format: ExportFormat = "ndjson",
+    gzip: bool = False,
+):
+    """
+    Exporta todos os usuários (id, nome, email) em NDJSON ou CSV, em
+    streaming a partir de um cursor do banco; somente para
+    administradores. Com `gzip=true`, devolve o arquivo comprimido
+    (`users.<formato>.gz`).
+    """
+    filename = f"users.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        export_users_service(
+            session,
+            format,
+            batch_size=settings.USER_EXPORT_BATCH_SIZE,
+            compress=gzip,
+        ),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.patch("/", status_code=HTTPStatus.OK, response_model=UserPublic)
@@ -48,16 +405,29 @@ async def patch_user(
     patch: UserPatch,
     current_user: T_CurrentUser,
 ):
-    return await patch_user_repo(
+    user = await patch_user_repo(
         session=session,
         user_input=patch,
         current_user=current_user,
     )
+    response = UserPublicResponse(user)
+    # As claims (sub/name) mudaram: reemite o access token
+    set_access_token_cookie(response, user)
+    return response
 
 
 @router.get("/me", response_model=UserPublic)
-async def read_me(current_user: T_CurrentUser):
-    return current_user
+async def read_me(current_user: T_CurrentClaims, request: Request):
+    """
+    Somente leitura: responde a partir das claims, sem acessar o banco.
+    A revalidação (ETag da claim `updated_at`) também não serializa nada.
+    """
+    not_modified, headers = conditional_response(
+        request, current_user.id, current_user.updated_at
+    )
+    if not_modified is not None:
+        return not_modified
+    return UserPublicResponse(current_user, headers=headers)
 
 
 @router.delete("/", status_code=status.HTTP_200_OK)
@@ -68,8 +438,12 @@ async def delete_user(
     current_user: T_CurrentUser,
 ):
     if delete_confirmation.confirmation:
-        await session.delete(current_user)
+        # O usuário pode vir do cache de autenticação (desanexado)
+        user = await session.merge(current_user, load=False)
+        await session.delete(user)
         await session.commit()
+        invalidate_cached_user(user.email.root)
+        invalidate_user_responses(user.email.root)
         response.delete_cookie(
             key="access_token",
             httponly=True,
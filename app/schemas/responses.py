@@ -0,0 +1,42 @@
+"""
+Respostas JSON pré-serializadas para `UserPublic`.
+
+As rotas continuam declarando `response_model=UserPublic` (OpenAPI), mas
+devolvem estas respostas prontas: o FastAPI não revalida a saída (os
+dados já vêm validados do banco ou das claims do token) e a serialização
+vai direto para bytes no serializador do pydantic-core.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi import Response
+from pydantic_core import to_json
+
+from infrastructure.server_timing import SERIALIZE, timed
+
+
+def user_public_dict(user: Any) -> dict:
+    """Campos de `UserPublic` a partir de `User`, `Row` ou `Principal`."""
+    return {"id": user.id, "name": user.name, "email": str(user.email)}
+
+
+def dump_user_public(user: Any) -> bytes:
+    with timed(SERIALIZE):
+        return to_json(user_public_dict(user))
+
+
+def dump_user_page(items: Iterable[Any], next_cursor: str | None) -> bytes:
+    """Mesmo formato de `UserPage`."""
+    with timed(SERIALIZE):
+        return to_json({
+            "items": [user_public_dict(user) for user in items],
+            "next_cursor": next_cursor,
+        })
+
+
+class UserPublicResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dump_user_public(content)
@@ -1,17 +1,25 @@
-from pydantic import BaseModel, EmailStr, ConfigDict
+from typing import Annotated, Any, Literal
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 from app.value_objects.email_vo import Email
+from app.value_objects.password import Password
+
+# Mesmo limite da coluna `users.name`: no lote, um nome longo demais
+# derrubaria o INSERT de todas as linhas
+UserName = Annotated[str, Field(min_length=1, max_length=100)]
 
 
 class UserCreate(BaseModel):
-    name: str
-    email: EmailStr
-    password: str
+    # Os campos já são os Value Objects: validados uma única vez, no parse
+    name: UserName
+    email: Email
+    password: Password
     model_config = ConfigDict(from_attributes=True)
 
 
 class GetByEmail(BaseModel):
-    email: EmailStr
+    email: Email
 
 
 class UserPublic(BaseModel):
@@ -21,6 +29,13 @@ class UserPublic(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserPage(BaseModel):
+    """Página da listagem; `next_cursor` é None na última página."""
+
+    items: list[UserPublic]
+    next_cursor: str | None = None
+
+
 class UserCreateResponse(BaseModel):
     user: UserPublic
     detail: str
@@ -28,9 +43,9 @@ class UserCreateResponse(BaseModel):
 
 
 class UserPatch(BaseModel):
-    name: str | None = None
-    new_email: EmailStr | None = None
-    password: str | None = None
+    name: UserName | None = None
+    new_email: Email | None = None
+    password: Password | None = None
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -41,3 +56,25 @@ class DeleteUser(BaseModel):
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
+
+
+class BulkUserResult(BaseModel):
+    """Resultado de um item da importação em lote (uma linha NDJSON)."""
+
+    index: int
+    status: Literal["created", "conflict", "invalid"]
+    id: int | None = None
+    email: str | None = None
+    errors: list[dict[str, Any]] | None = None
+
+
+class UserLookup(BaseModel):
+    emails: list[str] = Field(min_length=1)
+
+
+class UserLookupResult(BaseModel):
+    """Resultado de um email da busca em lote, na ordem de entrada."""
+
+    email: str
+    status: Literal["found", "not_found", "invalid"]
+    user: UserPublic | None = None
@@ -1,25 +1,114 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Annotated
 
-import jwt
-from fastapi import HTTPException, Request, status, Depends
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jwt.exceptions import PyJWTError, DecodeError
+from jwt.exceptions import DecodeError, PyJWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.repositories.authenticate import get_user_by_email_repo
+from app.services.authenticate import decode_token_service
 from app.settings import Settings
+from infrastructure.cache import TTLCache
 from infrastructure.db_context import get_session
+from infrastructure.password_hasher import password_hasher
+from infrastructure.rate_limit import (
+    ConcurrencyLimiter,
+    TokenBucketLimiter,
+    retry_after_header,
+)
 
 settings = Settings()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth")
 
+# Usuários autenticados indexados pelo `sub` do token (email).
+# Os objetos ficam desanexados da sessão original: rotas de escrita
+# devem usar `session.merge(user, load=False)` antes de alterá-los.
+user_cache: TTLCache[str, User] = TTLCache(
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    maxsize=settings.USER_CACHE_MAXSIZE,
+)
 
-async def get_current_user(
-    request: Request,
-    session: Annotated[AsyncSession, Depends(get_session)],
-) -> User:
+
+def invalidate_cached_user(*emails: str) -> None:
+    """Remove do cache os usuários alterados ou excluídos."""
+    for email in emails:
+        user_cache.pop(email)
+
+
+# Limites do login (POST /auth/): cada tentativa custa um verify Argon2.
+login_ip_limiter = TokenBucketLimiter(
+    capacity=settings.LOGIN_RATE_LIMIT_PER_IP,
+    period=settings.LOGIN_RATE_LIMIT_PERIOD_SECONDS,
+    maxsize=settings.LOGIN_RATE_LIMIT_MAXSIZE,
+)
+login_email_limiter = TokenBucketLimiter(
+    capacity=settings.LOGIN_RATE_LIMIT_PER_EMAIL,
+    period=settings.LOGIN_RATE_LIMIT_PERIOD_SECONDS,
+    maxsize=settings.LOGIN_RATE_LIMIT_MAXSIZE,
+)
+login_concurrency = ConcurrencyLimiter(
+    settings.LOGIN_MAX_CONCURRENCY or password_hasher.max_pending
+)
+
+
+def check_login_rate_limit(request: Request, email: str) -> None:
+    """Recusa com 429 quando o IP ou o email excederam as tentativas."""
+    if not settings.LOGIN_RATE_LIMIT_ENABLED:
+        return
+
+    # IP da conexão; atrás de proxy, configure o uvicorn com
+    # --proxy-headers para refletir o cliente real.
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = login_ip_limiter.acquire(client_ip)
+    if not retry_after:
+        retry_after = login_email_limiter.acquire(email)
+
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers=retry_after_header(retry_after),
+        )
+
+
+@contextmanager
+def login_admission() -> Iterator[None]:
+    """
+    Controle de admissão do login: recusa com 503 em vez de enfileirar
+    quando já há `LOGIN_MAX_CONCURRENCY` autenticações em andamento.
+    """
+    if not login_concurrency.try_acquire():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent logins",
+            headers=retry_after_header(1),
+        )
+    try:
+        yield
+    finally:
+        login_concurrency.release()
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    Usuário autenticado montado apenas a partir das claims do access token.
+    Não carrega a senha nem exige sessão com o banco.
+    """
+
+    id: int
+    name: str
+    email: str
+    # `updated_at` do usuário na emissão do token (µs desde a época)
+    updated_at: int | None = None
+
+
+def _get_token(request: Request) -> str:
     token = request.cookies.get("access_token")
 
     if not token:
@@ -36,10 +125,12 @@ async def get_current_user(
     if token.startswith("Bearer "):
         token = token.split(" ")[1]
 
+    return token
+
+
+def _decode_access_token(token: str) -> dict:
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = decode_token_service(token)
         email: str = payload.get("sub")
         token_type: str = payload.get("type")
 
@@ -50,9 +141,66 @@ async def get_current_user(
     except DecodeError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
+    return payload
+
+
+async def get_current_claims(request: Request) -> Principal:
+    """
+    Autenticação somente por claims: valida o token e monta o `Principal`
+    sem abrir `AsyncSession`. Indicada para rotas somente leitura.
+    """
+    payload = _decode_access_token(_get_token(request))
+
+    user_id = payload.get("id")
+    name = payload.get("name")
+    if not isinstance(user_id, int) or not isinstance(name, str):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+    updated_at = payload.get("updated_at")
+    return Principal(
+        id=user_id,
+        name=name,
+        email=payload["sub"],
+        updated_at=updated_at if isinstance(updated_at, int) else None,
+    )
+
+
+async def get_current_admin(
+    principal: Annotated[Principal, Depends(get_current_claims)],
+) -> Principal:
+    """
+    Rotas administrativas: o cadastro é aberto, então estar autenticado
+    não basta. Exige o id do token (atribuído pelo banco, não pelo
+    usuário) em `ADMIN_USER_IDS`.
+    """
+    if principal.id not in settings.ADMIN_USER_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
+    return principal
+
+
+async def get_current_user(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> User:
+    payload = _decode_access_token(_get_token(request))
+    email: str = payload["sub"]
+
+    if settings.USER_CACHE_ENABLED:
+        cached_user = user_cache.get(email)
+        if cached_user is not None:
+            return cached_user
+
     user = await get_user_by_email_repo(session, email)
 
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
+    if settings.USER_CACHE_ENABLED:
+        # Instância desanexada (fora desta sessão): um rollback aqui não
+        # a expira para as requisições seguintes
+        user_cache.set(email, user)
+
     return user
@@ -1,20 +1,34 @@
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import UTC, datetime, timedelta
+
 import jwt
+from fastapi import BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.settings import Settings
 from app.models.user import User
-from app.repositories.authenticate import get_user_by_email_repo
+from app.repositories.authenticate import (
+    get_user_by_email_repo,
+    update_password_hash_repo,
+)
+from app.settings import Settings
+from infrastructure.cache import TTLCache
+from infrastructure.password_hasher import password_hasher
+from infrastructure.server_timing import JWT, timed
 
 settings = Settings()
 
+# Payloads de tokens já verificados, indexados pelo token bruto.
+token_cache: TTLCache[str, dict] = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAXSIZE, clock=time.time
+)
+
 
 def create_access_token_service(
     data: dict, expires_delta: timedelta | None = None
 ) -> str:
     """Gera o token JWT assinado."""
     to_encode = data.copy()
-    now = datetime.now(timezone.utc)
+    now = datetime.now(UTC)
 
     if expires_delta:
         expire = now + expires_delta
@@ -26,9 +40,10 @@ def create_access_token_service(
         "iat": now,
         "type": "access",
     })
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    with timed(JWT):
+        encoded_jwt = jwt.encode(
+            to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+        )
     return encoded_jwt
 
 
@@ -37,7 +52,7 @@ def create_refresh_token_service(
 ) -> str:
     """Gera o refresh token JWT assinado."""
     to_encode = data.copy()
-    now = datetime.now(timezone.utc)
+    now = datetime.now(UTC)
 
     if expires_delta:
         expire = now + expires_delta
@@ -49,24 +64,75 @@ def create_refresh_token_service(
         "iat": now,
         "type": "refresh",
     })
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    with timed(JWT):
+        encoded_jwt = jwt.encode(
+            to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+        )
     return encoded_jwt
 
 
+def decode_token_service(token: str) -> dict:
+    """
+    Verifica a assinatura e decodifica o JWT, memorizando o payload.
+    A entrada expira no máximo junto com o `exp` do token.
+    Levanta `PyJWTError` para tokens inválidos, como `jwt.decode`.
+    O payload retornado é compartilhado: não deve ser alterado.
+    """
+    if settings.TOKEN_CACHE_ENABLED:
+        payload = token_cache.get(token)
+        if payload is not None and payload["exp"] > time.time():
+            return payload
+
+    with timed(JWT):
+        payload = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
+
+    exp = payload.get("exp")
+    if settings.TOKEN_CACHE_ENABLED and isinstance(exp, (int, float)):
+        ttl = min(exp - time.time(), settings.TOKEN_CACHE_TTL_SECONDS)
+        if ttl > 0:
+            token_cache.set(token, payload, ttl=ttl)
+
+    return payload
+
+
 async def authenticate_user_service(
-    session: AsyncSession, email: str, password: str
+    session: AsyncSession,
+    email: str,
+    password: str,
+    background_tasks: BackgroundTasks | None = None,
 ) -> User | None:
     """
     Orquestra a autenticação: Repo -> Validação de Senha.
+
+    Se o hash foi gerado com parâmetros do Argon2 diferentes dos atuais,
+    o novo hash é gravado após a resposta (`background_tasks`) ou, sem
+    elas, imediatamente.
     """
     user = await get_user_by_email_repo(session, email)
 
     if not user:
+        # Mantém o custo de CPU por login previsível (e sem revelar,
+        # pelo tempo de resposta, se o email existe)
+        if settings.LOGIN_DUMMY_VERIFY_ENABLED:
+            await password_hasher.verify_dummy(password)
         return None
 
-    if not user.password.verify_password(password):
+    valid, new_hash = await password_hasher.verify_and_update(
+        password, user.password.root.get_secret_value()
+    )
+    if not valid:
         return None
 
+    if new_hash is not None:
+        # O usuário em cache (get_current_user) pode manter o hash antigo:
+        # ele não é usado para login e o PATCH só grava colunas alteradas.
+        if background_tasks is not None:
+            background_tasks.add_task(
+                update_password_hash_repo, session, user.id, new_hash
+            )
+        else:
+            await update_password_hash_repo(session, user.id, new_hash)
+
     return user
@@ -0,0 +1,67 @@
+import csv
+import io
+import zlib
+from collections.abc import AsyncIterator, Callable
+from typing import Literal
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.user import stream_users_repo
+from app.schemas.responses import dump_user_public
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+CSV_HEADER = ("id", "name", "email")
+
+
+def _ndjson_chunk(rows: list[Row]) -> bytes:
+    return b"".join(dump_user_public(row) + b"\n" for row in rows)
+
+
+def _csv_chunk(rows: list[Row]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        (row.id, row.name, row.email.root) for row in rows
+    )
+    return buffer.getvalue().encode()
+
+
+async def export_users_service(
+    session: AsyncSession,
+    fmt: ExportFormat,
+    batch_size: int,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Gera a exportação de todos os usuários em blocos (um por lote do
+    cursor), opcionalmente comprimida em gzip, para `StreamingResponse`.
+    """
+    serialize: Callable[[list[Row]], bytes]
+    if fmt == "csv":
+        serialize = _csv_chunk
+        header = (",".join(CSV_HEADER) + "\r\n").encode()
+    else:
+        serialize = _ndjson_chunk
+        header = b""
+
+    # wbits=31: formato gzip (cabeçalho + CRC), comprimido incrementalmente
+    gzip = zlib.compressobj(wbits=31) if compress else None
+
+    def _encode(data: bytes) -> bytes:
+        return gzip.compress(data) if gzip else data
+
+    if header:
+        yield _encode(header)
+
+    async for rows in stream_users_repo(session, batch_size):
+        chunk = _encode(serialize(rows))
+        if chunk:
+            yield chunk
+
+    if gzip:
+        yield gzip.flush()
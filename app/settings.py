@@ -26,9 +26,88 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_TOKEN_EXPIRE_DAYS: int
 
+    # Ids dos usuários com acesso às rotas administrativas (importação,
+    # listagem e exportação). Não por email: qualquer um pode cadastrar
+    # ou trocar para um endereço livre. Vazio: rotas desativadas.
+    ADMIN_USER_IDS: list[int] = []
+
+    # Pool de conexões (por worker do uvicorn)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800  # segundos; -1 desativa
+    DB_POOL_PRE_PING: bool = True
+    # Validação periódica das conexões ociosas (0 desativa). Permite
+    # desligar o pre-ping e tirar o `SELECT 1` do caminho da requisição.
+    DB_HEALTH_CHECK_INTERVAL_SECONDS: float = 0
+
+    # Expõe GET /metrics/ (pool, caches, limites), sem autenticação:
+    # habilite só atrás de uma rede interna ou proxy que restrinja o acesso
+    METRICS_ENABLED: bool = False
+
+    # Cabeçalho Server-Timing + log por requisição (db, hash, jwt, serialize)
+    SERVER_TIMING_ENABLED: bool = False
+
     AUTH_COOKIE_SECURE: bool
     AUTH_COOKIE_SAMESITE: Literal["lax", "strict", "none"] = "lax"
 
+    # Custo do Argon2. Hashes com parâmetros antigos são atualizados
+    # de forma transparente no próximo login.
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_PARALLELISM: int = 4
+
+    # Pool de hashing de senhas (Argon2 fora do event loop)
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int | None = None  # None = os.cpu_count()
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    # Limites do login: tentativas por IP/email a cada período e
+    # autenticações simultâneas (None = workers + fila do hashing)
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_PERIOD_SECONDS: float = 60
+    LOGIN_RATE_LIMIT_PER_IP: int = 30
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 10
+    LOGIN_RATE_LIMIT_MAXSIZE: int = 100_000
+    LOGIN_MAX_CONCURRENCY: int | None = None
+    # Verify Argon2 fictício para emails inexistentes (custo constante)
+    LOGIN_DUMMY_VERIFY_ENABLED: bool = True
+
+    # Importação em lote (POST /users/bulk)
+    USER_BULK_BATCH_SIZE: int = 500
+    USER_BULK_MAX_ITEMS: int = 100_000
+
+    # Listagem paginada (GET /users/list)
+    USER_LIST_PAGE_SIZE: int = 50
+    USER_LIST_MAX_PAGE_SIZE: int = 500
+
+    # Busca em lote (POST /users/lookup): máximo de emails por requisição
+    USER_LOOKUP_MAX_EMAILS: int = 1000
+
+    # Exportação (GET /users/export): linhas por lote do cursor
+    USER_EXPORT_BATCH_SIZE: int = 1000
+
+    # Cache de respostas de GET /users/ (opcional, por worker). Emails
+    # inexistentes (404) ficam em cache por menos tempo.
+    USER_RESPONSE_CACHE_ENABLED: bool = False
+    USER_RESPONSE_CACHE_TTL_SECONDS: float = 30
+    USER_RESPONSE_CACHE_NEGATIVE_TTL_SECONDS: float = 5
+    USER_RESPONSE_CACHE_MAXSIZE: int = 10_000
+    USER_RESPONSE_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+
+    # Cache de usuários autenticados (get_current_user)
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_TTL_SECONDS: float = 60
+    USER_CACHE_MAXSIZE: int | None = 10_000
+
+    # Buscas simultâneas do mesmo usuário compartilham uma consulta
+    USER_LOOKUP_COALESCING_ENABLED: bool = True
+
+    # Cache de JWTs já verificados (nunca ultrapassa o `exp` do token)
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_TTL_SECONDS: float = 300
+    TOKEN_CACHE_MAXSIZE: int = 10_000
+
     @property
     def DATABASE_URL(self):
         return (
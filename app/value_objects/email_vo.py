@@ -3,11 +3,13 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from pydantic import RootModel, ConfigDict, field_validator
-from sqlalchemy import TypeDecorator, String
+from pydantic import ConfigDict, RootModel, field_validator
+from sqlalchemy import String, TypeDecorator
 
 # Regex atualizada e segura
 _EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s\.]+(\.[^@\s\.]+)+$")
+# Tamanho da coluna (`EmailType`)
+EMAIL_MAX_LENGTH = 255
 
 
 class Email(RootModel[str]):
@@ -21,7 +23,11 @@ class Email(RootModel[str]):
         if not value:
             raise ValueError("Email não pode ser vazio.")
 
-        if not _EMAIL_RE.match(value) or ".." in value:
+        if (
+            len(value) > EMAIL_MAX_LENGTH
+            or not _EMAIL_RE.match(value)
+            or ".." in value
+        ):
             raise ValueError("Email inválido.")
 
         return value.lower()
@@ -31,7 +37,7 @@ class Email(RootModel[str]):
 
 
 class EmailType(TypeDecorator):
-    impl = String(255)
+    impl = String(EMAIL_MAX_LENGTH)
     cache_ok = True
 
     def process_bind_param(
@@ -1,11 +1,51 @@
 import re
 import string
-from pydantic import RootModel, SecretStr, field_validator, ConfigDict
-from sqlalchemy import TypeDecorator, String
+
+import argon2
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from pydantic import ConfigDict, RootModel, SecretStr, field_validator
+from sqlalchemy import String, TypeDecorator
+
+from app.settings import Settings
+
+settings = Settings()
+
+# Configuração do algoritmo de hash (Argon2), com custo vindo do Settings
+pwd_context = PasswordHash((
+    Argon2Hasher(
+        time_cost=settings.ARGON2_TIME_COST,
+        memory_cost=settings.ARGON2_MEMORY_COST,
+        parallelism=settings.ARGON2_PARALLELISM,
+    ),
+))
+
+
+# Tamanho da coluna (`PasswordType`)
+PASSWORD_MAX_LENGTH = 255
+
+
+def is_supported_hash(value: str) -> bool:
+    """
+    Indica se `value` é um hash que o `pwd_context` identifica e cujos
+    parâmetros o Argon2 aceita (sem calcular o hash). Hashes gravados sem
+    essa checagem quebram o login (`UnknownHashError`).
+    """
+    if not any(hasher.identify(value) for hasher in pwd_context.hashers):
+        return False
+    try:
+        params = argon2.extract_parameters(value)
+    except argon2.exceptions.InvalidHashError:
+        return False
+    # Mínimos da libargon2
+    return (
+        params.time_cost >= 1
+        and params.parallelism >= 1
+        and params.memory_cost >= 8 * params.parallelism
+        and params.salt_len >= 8
+        and params.hash_len >= 4
+    )
 
-# Configuração do algoritmo de hash (Argon2 é o padrão recomendado do pwdlib)
-pwd_context = PasswordHash.recommended()
 
 # Compilando regex fora da classe
 _REGEX_HAS_LETTER = re.compile(r"[A-Za-z]")
@@ -62,7 +102,7 @@ class Password(RootModel):
 class PasswordType(TypeDecorator):
     """Persiste o Value Object `Password` como string no banco (VARCHAR)."""
 
-    impl = String(255)
+    impl = String(PASSWORD_MAX_LENGTH)
     cache_ok = True
 
     def process_bind_param(self, value: Password | str | None, dialect):  # type: ignore[override]
@@ -84,7 +124,9 @@ class PasswordType(TypeDecorator):
         if secret_val.startswith("$argon2"):
             return secret_val
 
-        # Se for texto plano, hasheia antes de salvar no banco
+        # Fallback síncrono para uso direto do ORM (fixtures, scripts).
+        # Os repositórios já entregam o hash gerado pelo
+        # `password_hasher`, evitando bloquear o event loop aqui.
         return pwd_context.hash(secret_val)
 
     def process_result_value(self, value: str | None, dialect):  # type: ignore[override]
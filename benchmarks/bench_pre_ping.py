@@ -0,0 +1,65 @@
+"""
+Compara a latência por requisição com e sem `pool_pre_ping`.
+
+Cada iteração simula uma requisição: checkout de conexão + uma consulta
+simples. Com pre-ping, o checkout inclui um `SELECT 1` extra.
+
+Uso (usa o DATABASE_URL do .env):
+    uv run python -m benchmarks.bench_pre_ping --iterations 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.settings import Settings
+
+
+async def _measure(url: str, pre_ping: bool, iterations: int) -> list[float]:
+    engine = create_async_engine(url, pool_size=1, pool_pre_ping=pre_ping)
+    query = text("SELECT 1")
+
+    # Aquece o pool: o pre-ping não roda em conexões recém-criadas
+    async with engine.connect() as conn:
+        await conn.execute(query)
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        async with engine.connect() as conn:
+            await conn.execute(query)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    await engine.dispose()
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    p95 = statistics.quantiles(samples, n=20)[-1]
+    return (
+        f"mean={statistics.fmean(samples):.3f}ms "
+        f"p50={statistics.median(samples):.3f}ms p95={p95:.3f}ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    url = Settings().DATABASE_URL
+    with_ping = await _measure(url, True, args.iterations)
+    without_ping = await _measure(url, False, args.iterations)
+
+    saved = statistics.fmean(with_ping) - statistics.fmean(without_ping)
+    print(f"pre_ping=True   {_summary(with_ping)}")
+    print(f"pre_ping=False  {_summary(without_ping)}")
+    print(f"economia média por requisição: {saved:.3f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
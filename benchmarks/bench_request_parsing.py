@@ -0,0 +1,103 @@
+"""
+Benchmark do parse das requisições de criação/edição de usuário.
+
+Compara os schemas antigos (`EmailStr` + `str`, com os Value Objects
+`Email`/`Password` revalidando os mesmos campos em `User.create` /
+`patch_user`) com os atuais, em que o schema já produz os Value Objects
+e cada campo é validado uma única vez. Mede só CPU (sem hash, rede ou
+banco): corpo JSON -> schema -> entidade.
+
+Uso:
+    uv run python -m benchmarks.bench_request_parsing --iterations 100000
+"""
+
+import argparse
+import time
+
+from pydantic import BaseModel, ConfigDict, EmailStr
+
+from app.models.user import User
+from app.schemas.user_schemas import UserCreate, UserPatch
+from app.value_objects.password import Password
+
+CREATE_BODY = (
+    b'{"name": "Maria da Silva", "email": "Maria@Example.com",'
+    b' "password": "S@@ecupass123"}'
+)
+PATCH_BODY = b'{"new_email": "maria.silva@example.com"}'
+# Hash fixo: `patch_user` recebe o hash já gerado pelo pool
+HASH = Password.hash_password("S@@ecupass123")
+
+
+class LegacyUserCreate(BaseModel):
+    name: str
+    email: EmailStr
+    password: str
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LegacyUserPatch(BaseModel):
+    name: str | None = None
+    new_email: EmailStr | None = None
+    password: str | None = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+def _create(schema: type[BaseModel]) -> User:
+    user_input = schema.model_validate_json(CREATE_BODY)
+    return User.create(
+        name=user_input.name,
+        email=user_input.email,
+        password=user_input.password,
+    )
+
+
+def _patch(schema: type[BaseModel], user: User) -> None:
+    user_input = schema.model_validate_json(PATCH_BODY)
+    user.patch_user(
+        name=user_input.name, new_email=user_input.new_email, password=HASH
+    )
+
+
+def _bench(label: str, fn, n: int) -> float:
+    for _ in range(1_000):  # aquecimento
+        fn()
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:36} {elapsed * 1e6 / n:7.2f} µs/requisição")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+    n = args.iterations
+
+    user = _create(UserCreate)
+
+    before = _bench(
+        "POST /users/ (EmailStr + VOs)",
+        lambda: _create(LegacyUserCreate),
+        n,
+    )
+    after = _bench(
+        "POST /users/ (VOs no schema)", lambda: _create(UserCreate), n
+    )
+    print(f"criação: {before / after:.1f}x mais rápida\n")
+
+    before = _bench(
+        "PATCH /users/ (EmailStr + VOs)",
+        lambda: _patch(LegacyUserPatch, user),
+        n,
+    )
+    after = _bench(
+        "PATCH /users/ (VOs no schema)", lambda: _patch(UserPatch, user), n
+    )
+    print(f"edição: {before / after:.1f}x mais rápida")
+
+
+if __name__ == "__main__":
+    main()
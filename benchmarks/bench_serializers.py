@@ -0,0 +1,105 @@
+"""
+Benchmark da serialização das respostas `UserPublic`.
+
+Compara o caminho padrão do FastAPI (`response_model=UserPublic`, com
+validação da saída + `dump_json`) com `UserPublicResponse` (bytes
+gerados direto pelo pydantic-core, sem revalidação). Mede a função de
+serialização isolada e requisições/s in-process via ASGI (sem rede nem
+banco), para isolar o custo da resposta.
+
+Uso:
+    uv run python -m benchmarks.bench_serializers --requests 20000
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.schemas.responses import UserPublicResponse, dump_user_public
+from app.schemas.user_schemas import UserPublic
+from app.security import Principal
+from app.value_objects.email_vo import Email
+
+
+class _Row:
+    """Mesmos atributos de uma `Row` das colunas públicas."""
+
+    def __init__(self) -> None:
+        self.id = 1
+        self.name = "Maria da Silva"
+        self.email = Email("maria@example.com")
+
+
+def _build_app(row: _Row) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=UserPublic)
+    async def default():
+        return row
+
+    @app.get("/fast", response_model=UserPublic)
+    async def fast():
+        return UserPublicResponse(row)
+
+    return app
+
+
+def _bench_serialize(label: str, fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:42} {elapsed * 1e6 / n:7.2f} µs/resposta")
+    return elapsed
+
+
+async def _bench_requests(app: FastAPI, path: str, n: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for _ in range(200):  # aquecimento
+            await client.get(path)
+        start = time.perf_counter()
+        for _ in range(n):
+            await client.get(path)
+        elapsed = time.perf_counter() - start
+    rps = n / elapsed
+    print(f"GET {path:38} {rps:9,.0f} req/s")
+    return rps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--serializations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    row = _Row()
+    principal = Principal(id=1, name=row.name, email=row.email.root)
+    n = args.serializations
+
+    before = _bench_serialize(
+        "UserPublic.model_validate + dump_json",
+        lambda: UserPublic.model_validate(row).model_dump_json(),
+        n,
+    )
+    after = _bench_serialize(
+        "dump_user_public (Row)", lambda: dump_user_public(row), n
+    )
+    _bench_serialize(
+        "dump_user_public (Principal)", lambda: dump_user_public(principal), n
+    )
+    print(f"serialização: {before / after:.1f}x mais rápida\n")
+
+    app = _build_app(row)
+    default_rps = asyncio.run(_bench_requests(app, "/default", args.requests))
+    fast_rps = asyncio.run(_bench_requests(app, "/fast", args.requests))
+    print(f"requisições: {(fast_rps / default_rps - 1) * 100:+.0f}% req/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compara o custo de hidratação por linha ao ler usuários como entidade
+completa (`select(User)`) e apenas com as colunas de `UserPublic`.
+
+A entidade completa passa por `PasswordType.process_result_value` e pelo
+mapeamento ORM; a projeção devolve `Row`s com id, nome e email.
+
+Roda em SQLite em memória, isolando o custo no lado do Python:
+    uv run python -m benchmarks.bench_user_projection --rows 20000
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import table_registry
+from app.models.user import User
+from app.repositories.user import PUBLIC_COLUMNS
+from app.value_objects.data_time_sp import tz_sp_now
+
+HASH = "$argon2id$v=19$m=65536,t=3,p=4$c29tZXNhbHQ$hash"
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(table_registry.metadata.create_all)
+        now = tz_sp_now()
+        await conn.execute(
+            insert(User),
+            [
+                {
+                    "name": f"User {i}",
+                    "email": f"user{i}@example.com",
+                    "password": HASH,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(args.rows)
+            ],
+        )
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    queries = {
+        "entidade (select(User))": lambda s: s.scalars(select(User)),
+        "projeção (id, name, email)": lambda s: s.execute(
+            select(*PUBLIC_COLUMNS)
+        ),
+    }
+
+    for label, run in queries.items():
+        best = float("inf")
+        for _ in range(args.repeat):
+            async with session_factory() as session:
+                start = time.perf_counter()
+                rows = (await run(session)).all()
+                best = min(best, time.perf_counter() - start)
+        assert len(rows) == args.rows
+        print(f"{label:28} {best * 1e6 / args.rows:7.2f} µs/linha")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+"""
+Microbenchmark da hidratação dos Value Objects na leitura do banco.
+
+Compara, para N linhas, a construção validada usada pelos TypeDecorators
+(`Email(value)`, `Password(hash)`) com `model_construct`, que pula a
+validação. `model_construct` não sai mais rápido (a validação do
+Pydantic roda em Rust), então os TypeDecorators validam sempre.
+
+Uso:
+    uv run python -m benchmarks.bench_vo_hydration --rows 100000
+"""
+
+import argparse
+import time
+
+from pydantic import SecretStr
+
+from app.value_objects.email_vo import Email
+from app.value_objects.password import Password
+
+HASH = "$argon2id$v=19$m=65536,t=3,p=4$c29tZXNhbHQ$aGFzaGhhc2hoYXNoaGFzaA"
+
+
+def _bench(label: str, fn, values: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in values:
+            fn(value)
+        best = min(best, time.perf_counter() - start)
+    print(
+        f"{label:36} {best * 1000:8.1f} ms"
+        f"  {best * 1e6 / len(values):.2f} µs/linha"
+    )
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    emails = [f"user{i}@example.com" for i in range(args.rows)]
+    hashes = [HASH] * args.rows
+
+    validated = _bench("Email(value)", Email, emails, args.repeat)
+    constructed = _bench(
+        "Email.model_construct(value)",
+        Email.model_construct,
+        emails,
+        args.repeat,
+    )
+    validated += _bench("Password(hash)", Password, hashes, args.repeat)
+    constructed += _bench(
+        "Password.model_construct(hash)",
+        lambda value: Password.model_construct(SecretStr(value)),
+        hashes,
+        args.repeat,
+    )
+    print(
+        f"{args.rows} linhas (email + senha): validado "
+        f"{validated * 1000:.1f} ms, model_construct "
+        f"{constructed * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
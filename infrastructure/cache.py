@@ -0,0 +1,103 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+_MISSING = object()
+
+
+class TTLCache[K: Hashable, V]:
+    """
+    Cache em memória com expiração (TTL) e descarte LRU.
+
+    - `ttl`: segundos até a entrada expirar (None = sem expiração).
+    - `maxsize`: número máximo de entradas (None = sem limite).
+    - `maxbytes`: soma máxima de `weigh(value)` (None = sem limite).
+
+    Não é thread-safe: pensado para uso dentro de um único event loop.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        maxsize: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        maxbytes: int | None = None,
+        weigh: Callable[[V], int] = lambda value: 0,
+    ) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._clock = clock
+        self._weigh = weigh
+        self._data: OrderedDict[K, tuple[float | None, V, int]] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: K, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value, _ = entry
+        if expires_at is not None and expires_at <= self._clock():
+            self._remove(key)
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Armazena `value`; `ttl` sobrescreve o padrão do cache."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self._clock() + ttl
+        size = self._weigh(value)
+
+        self._remove(key)
+        if self.maxbytes is not None and size > self.maxbytes:
+            # Nunca caberia: não descarta o cache inteiro por ela
+            return
+
+        self._data[key] = (expires_at, value, size)
+        self.bytes += size
+
+        while (
+            self.maxsize is not None and len(self._data) > self.maxsize
+        ) or (self.maxbytes is not None and self.bytes > self.maxbytes):
+            self._remove(next(iter(self._data)))
+
+    def _remove(self, key: K):
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[2]
+        return entry
+
+    def pop(self, key: K, default=None):
+        entry = self._remove(key)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "bytes": self.bytes,
+            "maxbytes": self.maxbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
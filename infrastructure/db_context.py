@@ -1,18 +1,40 @@
-from typing import AsyncGenerator
+from collections.abc import AsyncGenerator
+
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import (
-    create_async_engine,
-    async_sessionmaker,
     AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
 )
 
 from app.settings import Settings
+from infrastructure.db_health import ConnectionHealthChecker
+from infrastructure.pool_metrics import (
+    PoolMetrics,
+    instrument_engine,
+    instrumented_pool_class,
+)
+from infrastructure.server_timing import instrument_engine_timing
 
 settings = Settings()
 
+pool_metrics = PoolMetrics()
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
-    pool_pre_ping=True,
+    poolclass=instrumented_pool_class(pool_metrics),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+instrument_engine(engine, pool_metrics)
+instrument_engine_timing(engine)
+
+health_checker = ConnectionHealthChecker(
+    engine, interval=settings.DB_HEALTH_CHECK_INTERVAL_SECONDS
 )
 
 async_session_factory = async_sessionmaker(
@@ -23,10 +45,33 @@ async_session_factory = async_sessionmaker(
 )
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
+# `insert` com suporte a ON CONFLICT ... DO NOTHING por dialeto.
+# SQLite fica como fallback para os testes em memória.
+_DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def dialect_insert(session: AsyncSession):
+    """Retorna o `insert` específico do dialeto ligado à sessão."""
+    dialect_name = session.bind.dialect.name
+    try:
+        return _DIALECT_INSERTS[dialect_name]
+    except KeyError:
+        raise NotImplementedError(
+            f"ON CONFLICT não suportado para o dialeto {dialect_name!r}."
+        )
+
+
+async def get_session() -> AsyncGenerator[AsyncSession]:
     """
     Dependency Injection Generator.
-    Gerencia o ciclo de vida da sessão. O 'async with' garante o fechamento automático.
+    Gerencia o ciclo de vida da sessão. Criar a `AsyncSession` não toca no
+    pool: a conexão só é obtida na primeira consulta, então requisições
+    encerradas antes disso (401, 422, usuário em cache) não a usam. Como o
+    FastAPI reaproveita o resultado da dependência dentro da requisição,
+    `get_current_user` e a rota compartilham a mesma sessão.
     """
     async with async_session_factory() as session:
         try:
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+async def validate_idle_connections(engine: AsyncEngine) -> int:
+    """
+    Executa `SELECT 1` em cada conexão ociosa do pool e retorna quantas
+    estavam quebradas.
+
+    O `QueuePool` é FIFO: checkouts sequenciais percorrem as conexões
+    ociosas uma vez cada. Uma conexão quebrada é invalidada pelo próprio
+    SQLAlchemy (tratamento de desconexão), que também marca as demais
+    conexões antigas para reciclagem.
+    """
+    pool = engine.sync_engine.pool
+    idle = pool.checkedin() if isinstance(pool, QueuePool) else 1
+
+    broken = 0
+    for _ in range(idle):
+        try:
+            async with engine.connect() as conn:
+                await conn.exec_driver_sql("SELECT 1")
+        except DBAPIError as e:
+            if not e.connection_invalidated:
+                raise
+            broken += 1
+    return broken
+
+
+class ConnectionHealthChecker:
+    """
+    Alternativa ao `pool_pre_ping`: em vez de um `SELECT 1` a cada
+    checkout, valida periodicamente as conexões ociosas em segundo plano.
+    """
+
+    def __init__(self, engine: AsyncEngine, interval: float) -> None:
+        self.engine = engine
+        self.interval = interval
+        self.runs = 0
+        self.broken_connections = 0
+        self.errors = 0
+        self._task: asyncio.Task | None = None
+
+    async def run_once(self) -> int:
+        broken = await validate_idle_connections(self.engine)
+        self.runs += 1
+        self.broken_connections += broken
+        return broken
+
+    async def _run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception:
+                # Banco fora do ar: tenta de novo no próximo ciclo
+                self.errors += 1
+                logger.exception("Connection health check failed")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "interval": self.interval,
+            "runs": self.runs,
+            "broken_connections": self.broken_connections,
+            "errors": self.errors,
+        }
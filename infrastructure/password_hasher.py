@@ -0,0 +1,155 @@
+import asyncio
+import os
+import secrets
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Literal, TypeVar
+
+from app.settings import Settings
+from app.value_objects.password import pwd_context
+from infrastructure.server_timing import HASH, timed
+
+settings = Settings()
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Fila do pool de hashing cheia; a requisição deve ser recusada."""
+
+
+# Funções de módulo para que possam ser serializadas pelo ProcessPoolExecutor.
+def _hash(plain_password: str) -> str:
+    return pwd_context.hash(plain_password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _verify_and_update(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+class AsyncPasswordHasher:
+    """
+    Executa o hash/verify do Argon2 em um pool (thread ou processo),
+    liberando o event loop do uvicorn durante o cálculo.
+
+    A fila é limitada: quando `max_workers + max_queue` operações já
+    estão em andamento, novas chamadas falham com
+    `PasswordHasherBusyError` em vez de acumular latência.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue: int = 64,
+        executor_kind: Literal["thread", "process"] = "thread",
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = self.max_workers + max_queue
+        self.executor_kind = executor_kind
+        self._executor: Executor | None = None
+        self._pending = 0
+        self._dummy_hash: str | None = None
+
+    @property
+    def pending(self) -> int:
+        """Operações em execução ou aguardando na fila."""
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        # Criado sob demanda para não subir processos no import do módulo.
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hasher",
+                )
+        return self._executor
+
+    async def _run(self, fn: Callable[..., T], *args, wait: bool = False) -> T:
+        # `wait=True` é usado por chamadores que já limitam a própria
+        # concorrência (ex.: `hash_many`) e preferem esperar a falhar.
+        if not wait and self._pending >= self.max_pending:
+            raise PasswordHasherBusyError("Password hashing queue is full.")
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            # Inclui a espera na fila do pool: é o que a requisição sente
+            with timed(HASH):
+                return await loop.run_in_executor(
+                    self._get_executor(), fn, *args
+                )
+        finally:
+            self._pending -= 1
+
+    async def hash(self, plain_password: str) -> str:
+        """Gera o hash da senha sem bloquear o event loop."""
+        return await self._run(_hash, plain_password)
+
+    async def hash_many(self, plain_passwords: list[str]) -> list[str]:
+        """
+        Gera os hashes em paralelo, no máximo `max_workers` por vez,
+        preservando a ordem de entrada. Usado em importações em lote.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def _bounded(plain_password: str) -> str:
+            async with semaphore:
+                return await self._run(_hash, plain_password, wait=True)
+
+        return await asyncio.gather(*map(_bounded, plain_passwords))
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verifica a senha contra o hash sem bloquear o event loop."""
+        return await self._run(_verify, plain_password, hashed_password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        Verifica a senha e, se o hash usa parâmetros diferentes dos
+        atuais, devolve também um novo hash (senão, None).
+        """
+        return await self._run(
+            _verify_and_update, plain_password, hashed_password
+        )
+
+    async def verify_dummy(self, plain_password: str) -> None:
+        """
+        Verifica a senha contra um hash descartável, com os mesmos
+        parâmetros dos hashes reais: um login de email inexistente custa
+        o mesmo que o de um usuário com senha errada.
+        """
+        if self._dummy_hash is None:
+            # Gerado uma vez, no próprio pool, com uma senha aleatória
+            self._dummy_hash = await self._run(
+                _hash, secrets.token_urlsafe(16)
+            )
+        await self._run(_verify, plain_password, self._dummy_hash)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Encerra o pool; uma nova chamada recria o executor."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+password_hasher = AsyncPasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    executor_kind=settings.PASSWORD_HASH_EXECUTOR,
+)
@@ -0,0 +1,144 @@
+import time
+from bisect import bisect_left
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+# Limites superiores (ms) dos buckets do histograma de espera por conexão.
+DEFAULT_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class Histogram:
+    """Histograma cumulativo simples, no formato usado pelo Prometheus."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # último = +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict:
+        cumulative, total = {}, 0
+        for bound, bucket_count in zip((*self.buckets, "+Inf"), self.counts):
+            total += bucket_count
+            cumulative[str(bound)] = total
+        return {"count": self.count, "sum": self.sum, "buckets": cumulative}
+
+
+class PoolMetrics:
+    """
+    Métricas do pool de conexões, alimentadas por eventos do SQLAlchemy
+    e pelo tempo de espera medido em `InstrumentedAsyncQueuePool`.
+    """
+
+    def __init__(
+        self, wait_buckets_ms: tuple[float, ...] = DEFAULT_WAIT_BUCKETS_MS
+    ) -> None:
+        self._wait_buckets_ms = wait_buckets_ms
+        self.pool: Pool | None = None
+        self.reset()
+
+    def reset(self) -> None:
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.pre_ping_failures = 0
+        self.checkout_timeouts = 0
+        self.wait_ms = Histogram(self._wait_buckets_ms)
+
+    def snapshot(self) -> dict:
+        data = {
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "pre_ping_failures": self.pre_ping_failures,
+            "checkout_timeouts": self.checkout_timeouts,
+            "wait_ms": self.wait_ms.snapshot(),
+        }
+        # Estado ao vivo do pool (apenas para pools baseados em fila)
+        if isinstance(self.pool, AsyncAdaptedQueuePool):
+            data.update(
+                size=self.pool.size(),
+                checked_in=self.pool.checkedin(),
+                checked_out=self.pool.checkedout(),
+                overflow=self.pool.overflow(),
+            )
+        return data
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    `AsyncAdaptedQueuePool` que mede quanto tempo cada checkout esperou
+    por uma conexão (fila cheia ou abertura de conexão nova).
+    """
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.checkout_timeouts += 1
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.wait_ms.observe(
+                    (time.perf_counter() - start) * 1000
+                )
+
+
+def instrumented_pool_class(
+    metrics: PoolMetrics,
+) -> type[InstrumentedAsyncQueuePool]:
+    """
+    Cria uma subclasse ligada a `metrics`. Guardar as métricas na classe
+    (e não na instância) as preserva quando o pool é recriado em
+    `engine.dispose()`.
+    """
+    return type(
+        "InstrumentedAsyncQueuePool",
+        (InstrumentedAsyncQueuePool,),
+        {"metrics": metrics},
+    )
+
+
+def instrument_engine(engine: AsyncEngine, metrics: PoolMetrics) -> None:
+    """Registra os eventos do pool/engine que alimentam `metrics`."""
+    sync_engine = engine.sync_engine
+    metrics.pool = sync_engine.pool
+
+    @event.listens_for(sync_engine, "engine_disposed")
+    def _on_dispose(*_):
+        metrics.pool = sync_engine.pool
+
+    @event.listens_for(sync_engine.pool, "connect")
+    def _on_connect(*_):
+        metrics.connects += 1
+
+    @event.listens_for(sync_engine.pool, "checkout")
+    def _on_checkout(*_):
+        metrics.checkouts += 1
+
+    @event.listens_for(sync_engine.pool, "checkin")
+    def _on_checkin(*_):
+        metrics.checkins += 1
+
+    @event.listens_for(sync_engine.pool, "invalidate")
+    def _on_invalidate(*_):
+        metrics.invalidations += 1
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _on_error(context):
+        if context.is_pre_ping:
+            metrics.pre_ping_failures += 1
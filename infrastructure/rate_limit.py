@@ -0,0 +1,111 @@
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+
+class TokenBucketLimiter:
+    """
+    Rate limiter em memória por chave (token bucket).
+
+    Cada chave tem até `capacity` tokens, repostos continuamente à taxa de
+    `capacity / period` por segundo: na prática, no máximo `capacity`
+    tentativas em qualquer janela deslizante de `period` segundos, com
+    rajadas permitidas até a capacidade.
+
+    A memória é limitada por `maxsize` (descarte LRU). Uma chave
+    descartada volta com o balde cheio, então `maxsize` deve cobrir o
+    número de chaves ativas em um período.
+
+    Não é thread-safe: pensado para uso dentro de um único event loop.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        period: float,
+        maxsize: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.period = period
+        self.rate = capacity / period
+        self.maxsize = maxsize
+        self._clock = clock
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = (
+            OrderedDict()
+        )
+        self.rejected = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, key: Hashable) -> float:
+        """
+        Consome um token de `key`. Retorna 0 se permitido ou, se não,
+        quantos segundos faltam para o próximo token.
+        """
+        now = self._clock()
+        tokens, updated_at = self._buckets.get(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated_at) * self.rate)
+
+        if tokens >= 1:
+            tokens -= 1
+            retry_after = 0.0
+        else:
+            retry_after = (1 - tokens) / self.rate
+            self.rejected += 1
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self.rejected = 0
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._buckets),
+            "maxsize": self.maxsize,
+            "capacity": self.capacity,
+            "period": self.period,
+            "rejected": self.rejected,
+        }
+
+
+class ConcurrencyLimiter:
+    """
+    Limita quantas operações rodam ao mesmo tempo, sem fila: quem chega
+    com o limite atingido é recusado na hora (`try_acquire` -> False).
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.rejected = 0
+
+    def try_acquire(self) -> bool:
+        if self.in_flight >= self.limit:
+            self.rejected += 1
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+        }
+
+
+def retry_after_header(seconds: float) -> dict[str, str]:
+    """Cabeçalho `Retry-After` em segundos inteiros (mínimo 1)."""
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
@@ -0,0 +1,144 @@
+"""
+Detalhamento do tempo de cada requisição (cabeçalho `Server-Timing`).
+
+`ServerTimingMiddleware` abre um acumulador por requisição (ContextVar);
+`timed()` e os eventos do engine somam nele o tempo de banco, hashing,
+tokens e serialização. Na resposta, os totais viram o cabeçalho
+`Server-Timing` (visível no DevTools) e, ao fim da requisição, uma linha
+de log `chave=valor`. Fora de uma requisição instrumentada, `timed()` e
+os eventos não medem nada.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+DB = "db"
+HASH = "hash"
+JWT = "jwt"
+SERIALIZE = "serialize"
+TOTAL = "total"
+
+
+class Timings:
+    """Tempo acumulado (segundos) e número de ocorrências por métrica."""
+
+    __slots__ = ("counts", "durations")
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def header(self, total: float) -> str:
+        """Valor do cabeçalho `Server-Timing` (durações em ms)."""
+        metrics = [
+            f"{name};dur={seconds * 1000:.2f}"
+            for name, seconds in self.durations.items()
+        ]
+        metrics.append(f"{TOTAL};dur={total * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+_current: ContextVar[Timings | None] = ContextVar(
+    "server_timing", default=None
+)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Soma a duração do bloco em `name` na requisição atual, se houver."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - start)
+
+
+def instrument_engine_timing(engine: AsyncEngine) -> None:
+    """Mede a execução de cada statement do engine como `db`."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            context._server_timing_start = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        timings = _current.get()
+        start = getattr(context, "_server_timing_start", None)
+        if timings is not None and start is not None:
+            timings.add(DB, time.perf_counter() - start)
+
+
+class ServerTimingMiddleware:
+    """
+    Middleware ASGI puro (sem `BaseHTTPMiddleware`): não bufferiza o
+    corpo nem muda de task, então o acumulador é o mesmo visto pelas
+    dependências, pela rota e pelas background tasks.
+
+    O `total` do cabeçalho vai até o início da resposta; o do log, até o
+    último byte (inclui corpo em streaming e background tasks).
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = Timings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                header = timings.header(time.perf_counter() - start)
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"server-timing", header.encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            _log(scope, status_code, timings, time.perf_counter() - start)
+
+
+def _log(scope, status_code: int, timings: Timings, total: float) -> None:
+    fields = {
+        "method": scope["method"],
+        "path": scope["path"],
+        "status": status_code,
+        f"{TOTAL}_ms": round(total * 1000, 2),
+    }
+    for name, seconds in timings.durations.items():
+        fields[f"{name}_ms"] = round(seconds * 1000, 2)
+        fields[f"{name}_count"] = timings.counts[name]
+
+    logger.info(
+        " ".join(f"{key}={value}" for key, value in fields.items()),
+        extra={"server_timing": fields},
+    )
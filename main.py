@@ -1,7 +1,48 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from app.routers import auth, metrics, users
+from app.settings import Settings
+from infrastructure.db_context import health_checker
+from infrastructure.password_hasher import (
+    PasswordHasherBusyError,
+    password_hasher,
+)
+from infrastructure.rate_limit import retry_after_header
+from infrastructure.server_timing import ServerTimingMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if health_checker.interval > 0:
+        health_checker.start()
+    yield
+    await health_checker.stop()
+    password_hasher.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(
+    request: Request, exc: PasswordHasherBusyError
+) -> JSONResponse:
+    # Fila do Argon2 cheia: recusa rápido em vez de acumular latência
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server busy, try again later"},
+        headers=retry_after_header(1),
+    )
 
-from app.routers import users, auth
 
-app = FastAPI()
 app.include_router(users.router)
 app.include_router(auth.router)
+
+if Settings().METRICS_ENABLED:
+    app.include_router(metrics.router)
+
+if Settings().SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
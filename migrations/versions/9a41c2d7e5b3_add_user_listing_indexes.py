@@ -0,0 +1,45 @@
+"""add user listing indexes
+
+Revision ID: 9a41c2d7e5b3
+Revises: c003f16a33d9
+Create Date: 2026-10-18 10:12:31.402917
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a41c2d7e5b3"
+down_revision: str | Sequence[str] | None = "c003f16a33d9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_created_at_id", "users", ["created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_users_name_pattern",
+        "users",
+        ["name"],
+        unique=False,
+        postgresql_ops={"name": "varchar_pattern_ops"},
+    )
+    op.create_index(
+        "ix_users_email_pattern",
+        "users",
+        ["email"],
+        unique=False,
+        postgresql_ops={"email": "varchar_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_email_pattern", table_name="users")
+    op.drop_index("ix_users_name_pattern", table_name="users")
+    op.drop_index("ix_users_created_at_id", table_name="users")
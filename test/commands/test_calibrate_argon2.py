@@ -0,0 +1,62 @@
+from app.commands.calibrate_argon2 import (
+    Measurement,
+    calibrate,
+    measure,
+    percentile,
+    recommend,
+)
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 21)]
+
+    assert percentile(values, 50) == 10
+    assert percentile(values, 95) == 19
+    assert percentile([7.0], 95) == 7
+
+
+def test_measure_reports_timings_for_params():
+    result = measure(memory_cost=8192, time_cost=1, parallelism=1, samples=3)
+
+    assert (result.memory_cost, result.time_cost, result.parallelism) == (
+        8192,
+        1,
+        1,
+    )
+    assert 0 < result.p50_ms <= result.p95_ms
+
+
+def test_recommend_picks_strongest_within_budget():
+    measurements = [
+        Measurement(19456, 2, 1, p50_ms=10, p95_ms=12),
+        Measurement(65536, 3, 4, p50_ms=40, p95_ms=48),
+        Measurement(65536, 3, 1, p50_ms=45, p95_ms=49),
+        Measurement(131072, 3, 1, p50_ms=90, p95_ms=95),
+    ]
+
+    best = recommend(measurements, target_ms=50)
+
+    # Mesma força: prefere menos paralelismo
+    assert best == measurements[2]
+    assert best.as_env() == (
+        "ARGON2_TIME_COST=3\nARGON2_MEMORY_COST=65536\nARGON2_PARALLELISM=1"
+    )
+
+
+def test_recommend_returns_none_when_nothing_fits():
+    assert recommend([Measurement(65536, 3, 1, 80, 90)], target_ms=50) is None
+
+
+def test_calibrate_measures_whole_grid():
+    measurements = calibrate(
+        target_ms=1000,
+        memory_costs=(8192,),
+        time_costs=(1, 2),
+        parallelisms=(1,),
+        samples=1,
+    )
+
+    assert [(m.memory_cost, m.time_cost) for m in measurements] == [
+        (8192, 1),
+        (8192, 2),
+    ]
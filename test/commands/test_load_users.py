@@ -0,0 +1,134 @@
+import json
+
+import pytest
+
+from app.commands.load_users import (
+    LoadReport,
+    build_records,
+    iter_chunks,
+    iter_source_rows,
+    validate_row,
+)
+
+HASH = "$argon2id$v=19$m=65536,t=3,p=4$c29tZXNhbHQ$aGFzaGhhc2hoYXNoaGFzaA"
+
+
+def test_validate_row_accepts_plain_and_prehashed_passwords():
+    plain = validate_row(
+        2, {"name": "A", "email": "A@Ex.com", "password": "S@@ecupass1"}
+    )
+    hashed = validate_row(
+        3, {"name": "B", "email": "b@ex.com", "password": HASH}
+    )
+
+    assert plain.email == "a@ex.com"
+    assert plain.needs_hash is True
+    assert hashed.needs_hash is False
+
+
+@pytest.mark.parametrize(
+    ("row", "reason"),
+    [
+        ({"name": "", "email": "a@ex.com", "password": HASH}, "invalid name"),
+        ({"name": "A", "email": "nope", "password": HASH}, "invalid email"),
+        (
+            {"name": "A", "email": "a@ex.com", "password": "short"},
+            "invalid password",
+        ),
+        ({}, "invalid name"),
+        ({"name": 5, "email": "a@ex.com", "password": HASH}, "invalid name"),
+        (
+            {"name": "A", "email": ["a@ex.com"], "password": HASH},
+            "invalid email",
+        ),
+        (
+            {"name": "A", "email": "a@ex.com", "password": 123},
+            "invalid password",
+        ),
+        (
+            {"name": "A", "email": "a@ex.com", "password": "$argon2garbage"},
+            "invalid password hash",
+        ),
+        (
+            # Formato reconhecido, mas digest curto demais para o Argon2
+            {
+                "name": "A",
+                "email": "a@ex.com",
+                "password": "$argon2id$v=19$m=65536,t=3,p=4$c29tZXNhbHQ$hash",
+            },
+            "invalid password hash",
+        ),
+        (
+            {"name": "A", "email": "a" * 250 + "@ex.com", "password": HASH},
+            "invalid email",
+        ),
+        (
+            # Hash válido, mas maior que a coluna (255)
+            {
+                "name": "A",
+                "email": "a@ex.com",
+                "password": "$argon2id$v=19$m=65536,t=3,p=4$c29tZXNhbHQ$"
+                + "aGFzaA" * 40,
+            },
+            "invalid password hash",
+        ),
+    ],
+)
+def test_validate_row_rejections(row, reason):
+    with pytest.raises(ValueError, match=reason):
+        validate_row(2, row)
+
+
+def test_iter_chunks_reports_rejections_and_duplicates():
+    rows = [
+        (2, {"name": "A", "email": "a@ex.com", "password": HASH}),
+        (3, {"name": "B", "email": "bad", "password": HASH}),
+        (4, {"name": "C", "email": "A@EX.COM", "password": HASH}),
+        (5, {"name": "D", "email": "d@ex.com", "password": HASH}),
+        (6, {"name": "E", "email": "e@ex.com", "password": HASH}),
+        (7, {"name": 5, "email": "f@ex.com", "password": HASH}),
+    ]
+    report = LoadReport()
+
+    chunks = list(iter_chunks(iter(rows), chunk_size=2, report=report))
+
+    assert [[r.line for r in chunk] for chunk in chunks] == [[2, 5], [6]]
+    assert report.read == 6
+    assert [(r.line, r.reason) for r in report.rejections] == [
+        (3, "invalid email"),
+        (4, "duplicate email"),
+        (7, "invalid name"),
+    ]
+
+
+def test_iter_source_rows_csv_and_ndjson(tmp_path):
+    csv_file = tmp_path / "users.csv"
+    csv_file.write_text("name,email,password\nA,a@ex.com,x\n")
+    ndjson_file = tmp_path / "users.ndjson"
+    ndjson_file.write_text(
+        json.dumps({"name": "B", "email": "b@ex.com"}) + "\n\n{broken\n"
+    )
+
+    assert list(iter_source_rows(csv_file)) == [
+        (2, {"name": "A", "email": "a@ex.com", "password": "x"})
+    ]
+    assert list(iter_source_rows(ndjson_file)) == [
+        (1, {"name": "B", "email": "b@ex.com"}),
+        (3, {}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_build_records_hashes_only_plain_passwords():
+    chunk = [
+        validate_row(
+            2, {"name": "A", "email": "a@ex.com", "password": "S@@ecupass1"}
+        ),
+        validate_row(3, {"name": "B", "email": "b@ex.com", "password": HASH}),
+    ]
+
+    records = await build_records(chunk)
+
+    assert records[0][2].startswith("$argon2") and records[0][2] != HASH
+    assert records[1][2] == HASH
+    assert records[0][3] == records[0][4]
@@ -6,23 +6,33 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from test.factories.models import UserFactory
 
-
 os.environ.setdefault("AUTH_COOKIE_SECURE", "false")
+# Desligado por padrão; os testes cobrem GET /metrics/
+os.environ.setdefault("METRICS_ENABLED", "true")
+
+from collections.abc import AsyncGenerator
 
 import pytest
 import pytest_asyncio
+from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import (
-    create_async_engine,
     AsyncSession,
     async_sessionmaker,
+    create_async_engine,
 )
 from sqlalchemy.pool import StaticPool
-from fastapi.testclient import TestClient
-from typing import AsyncGenerator
 
+from app.http_cache import user_response_cache
 from app.models import table_registry
-from main import app
+from app.security import (
+    login_email_limiter,
+    login_ip_limiter,
+    user_cache,
+)
+from app.services.authenticate import token_cache
 from infrastructure.db_context import get_session
+from infrastructure.server_timing import instrument_engine_timing
+from main import app
 
 # 1. Configuração da Engine
 # StaticPool é vital para :memory:
@@ -33,6 +43,8 @@ engine = create_async_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+# Mesma instrumentação do engine real (sem efeito fora do middleware)
+instrument_engine_timing(engine)
 
 TestingSessionLocal = async_sessionmaker(
     bind=engine,
@@ -42,6 +54,23 @@ TestingSessionLocal = async_sessionmaker(
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_in_memory_state():
+    """Caches em memória não podem vazar entre testes (o banco é recriado)."""
+    caches = (
+        user_cache,
+        token_cache,
+        user_response_cache,
+        login_ip_limiter,
+        login_email_limiter,
+    )
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
 # 2. Fixture de Ciclo de Vida do Banco (Responsável ÚNICA pelas tabelas)
 @pytest_asyncio.fixture(scope="function")
 async def setup_db():
@@ -60,7 +89,7 @@ async def setup_db():
 
 # 3. Fixture da Sessão (Depende de setup_db)
 @pytest_asyncio.fixture(scope="function")
-async def session(setup_db) -> AsyncGenerator[AsyncSession, None]:
+async def session(setup_db) -> AsyncGenerator[AsyncSession]:
     """
     Entrega uma sessão pronta para uso nos testes de unidade (modelos/services).
     """
@@ -79,9 +108,14 @@ def client(setup_db):
     Removemos o asyncio.run e a criação de tabelas daqui.
     """
 
+    # Mesmo ciclo de vida de `get_session` (inclusive o rollback em erro)
     async def get_session_override():
         async with TestingSessionLocal() as session:
-            yield session
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
 
     app.dependency_overrides[get_session] = get_session_override
 
@@ -0,0 +1,84 @@
+from infrastructure.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_get_set_and_stats():
+    cache = TTLCache(ttl=10)
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30)
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" passa a ser o menos usado
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_cache_pop_and_clear():
+    cache = TTLCache()
+    cache.set("a", 1)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+
+    cache.set("b", 2)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_evicts_lru_by_total_bytes():
+    cache = TTLCache(maxbytes=10, weigh=len)
+    cache.set("a", b"xxxx")
+    cache.set("b", b"yyyy")
+    cache.get("a")  # "b" passa a ser a menos usada
+
+    cache.set("c", b"zzzz")
+
+    assert "b" not in cache
+    assert cache.get("a") == b"xxxx"
+    assert cache.bytes == 8
+
+
+def test_cache_skips_values_larger_than_maxbytes():
+    cache = TTLCache(maxbytes=10, weigh=len)
+    cache.set("a", b"small")
+    cache.set("big", b"x" * 11)
+
+    assert "big" not in cache
+    assert cache.get("a") == b"small"
+
+    cache.set("a", b"replaced!")
+    assert cache.bytes == 9
+    cache.pop("a")
+    assert cache.bytes == 0
@@ -0,0 +1,63 @@
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import event, text
+
+from test.conftest import TestingSessionLocal, engine
+
+
+@pytest.fixture
+def checkouts():
+    """Conta as conexões retiradas do pool do engine de testes."""
+    counter = {"n": 0}
+
+    def _on_checkout(*_):
+        counter["n"] += 1
+
+    event.listen(engine.sync_engine.pool, "checkout", _on_checkout)
+    yield counter
+    event.remove(engine.sync_engine.pool, "checkout", _on_checkout)
+
+
+@pytest.mark.asyncio
+async def test_session_checks_out_connection_on_first_query(
+    setup_db, checkouts
+):
+    async with TestingSessionLocal() as session:
+        await session.rollback()  # sem conexão: nada a desfazer
+        assert checkouts["n"] == 0
+
+        assert await session.scalar(text("SELECT 1")) == 1
+        assert await session.scalar(text("SELECT 2")) == 2
+        assert checkouts["n"] == 1
+
+
+def test_unauthenticated_request_never_checks_out(client, checkouts):
+    response = client.patch("/users/", json={"name": "Nope"})
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert checkouts["n"] == 0
+
+
+def test_invalid_body_never_checks_out(client, checkouts):
+    response = client.post("/users/", json={"name": "No email"})
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert checkouts["n"] == 0
+
+
+def test_current_user_and_route_share_one_checkout(
+    client, user_on_db, checkouts
+):
+    client.post(
+        "/auth/",
+        json={"email": user_on_db.email.root, "password": "DefaultP@ssw0rd!"},
+    )
+    checkouts["n"] = 0
+
+    response = client.patch("/users/", json={"name": "Shared"})
+
+    # Uma transação até o commit (busca do usuário + UPDATE) e outra no
+    # refresh; `get_current_user` não abre uma sessão própria
+    assert response.status_code == HTTPStatus.OK
+    assert checkouts["n"] == 2
@@ -0,0 +1,67 @@
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from infrastructure.db_health import (
+    ConnectionHealthChecker,
+    validate_idle_connections,
+)
+
+
+def _make_engine(tmp_path, **kwargs):
+    return create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'health.db'}",
+        pool_size=3,
+        pool_pre_ping=False,
+        **kwargs,
+    )
+
+
+async def _open_idle_connections(engine, count):
+    conns = [await engine.connect() for _ in range(count)]
+    for conn in conns:
+        await conn.execute(text("SELECT 1"))
+    for conn in conns:
+        await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_validate_idle_connections_visits_each_connection(tmp_path):
+    engine = _make_engine(tmp_path)
+    await _open_idle_connections(engine, 3)
+
+    visited = set()
+
+    @event.listens_for(engine.sync_engine.pool, "checkout")
+    def _on_checkout(dbapi_conn, *_):
+        visited.add(id(dbapi_conn))
+
+    assert await validate_idle_connections(engine) == 0
+    assert len(visited) == 3
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_health_checker_discards_broken_connection(tmp_path):
+    # Sem rollback na devolução, a conexão fechada volta ociosa ao pool
+    engine = _make_engine(tmp_path, pool_reset_on_return=None)
+    await _open_idle_connections(engine, 1)
+
+    # Simula uma conexão derrubada pelo servidor enquanto ociosa
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.close()
+
+    def _is_disconnect(e, connection, cursor):
+        return True
+
+    engine.sync_engine.dialect.is_disconnect = _is_disconnect
+
+    checker = ConnectionHealthChecker(engine, interval=30)
+    assert await checker.run_once() == 1
+    assert checker.stats()["broken_connections"] == 1
+
+    # O pool volta a entregar conexões saudáveis
+    async with engine.connect() as conn:
+        assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+    await engine.dispose()
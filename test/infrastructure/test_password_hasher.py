@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from infrastructure.password_hasher import (
+    AsyncPasswordHasher,
+    PasswordHasherBusyError,
+)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_roundtrip():
+    hasher = AsyncPasswordHasher(max_workers=2, max_queue=2)
+
+    hashed = await hasher.hash("S@@ecupassword12")
+
+    assert hashed.startswith("$argon2")
+    assert await hasher.verify("S@@ecupassword12", hashed) is True
+    assert await hasher.verify("WrongPass1!", hashed) is False
+    assert hasher.pending == 0
+
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_verify_dummy_reuses_hash_with_current_params():
+    hasher = AsyncPasswordHasher(max_workers=1, max_queue=1)
+
+    await hasher.verify_dummy("S@@ecupassword12")
+    dummy_hash = hasher._dummy_hash
+    await hasher.verify_dummy("OtherP@ss123")
+
+    assert dummy_hash.startswith("$argon2")
+    assert hasher._dummy_hash == dummy_hash
+    assert hasher.pending == 0
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_runs_concurrently_up_to_queue_limit():
+    hasher = AsyncPasswordHasher(max_workers=2, max_queue=2)
+
+    hashes = await asyncio.gather(
+        *(hasher.hash(f"S@@ecupass{i}") for i in range(4))
+    )
+
+    assert len(set(hashes)) == 4
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_rejects_when_queue_is_full():
+    hasher = AsyncPasswordHasher(max_workers=1, max_queue=0)
+
+    first = asyncio.create_task(hasher.hash("S@@ecupassword12"))
+    await asyncio.sleep(0)  # garante que a primeira chamada ocupou o slot
+
+    with pytest.raises(PasswordHasherBusyError):
+        await hasher.hash("S@@ecupassword12")
+
+    assert (await first).startswith("$argon2")
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_executor_hash_and_verify():
+    hasher = AsyncPasswordHasher(max_workers=1, executor_kind="process")
+
+    hashed = await hasher.hash("S@@ecupassword12")
+
+    assert await hasher.verify("S@@ecupassword12", hashed) is True
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_many_waits_instead_of_rejecting():
+    hasher = AsyncPasswordHasher(max_workers=2, max_queue=0)
+    passwords = [f"S@@ecupass{i}" for i in range(5)]
+
+    hashes = await hasher.hash_many(passwords)
+
+    assert len(hashes) == 5
+    for plain, hashed in zip(passwords, hashes):
+        assert await hasher.verify(plain, hashed) is True
+    hasher.shutdown()
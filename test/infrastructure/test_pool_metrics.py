@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from infrastructure.pool_metrics import (
+    Histogram,
+    PoolMetrics,
+    instrument_engine,
+    instrumented_pool_class,
+)
+
+
+def _make_engine(tmp_path, metrics, **pool_kwargs):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented_pool_class(metrics),
+        **pool_kwargs,
+    )
+    instrument_engine(engine, metrics)
+    return engine
+
+
+def test_histogram_cumulative_buckets():
+    histogram = Histogram((1, 10))
+    for value in (0.5, 5, 50):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 3
+    assert snapshot["buckets"] == {"1": 1, "10": 2, "+Inf": 3}
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_track_checkouts_and_live_state(tmp_path):
+    metrics = PoolMetrics()
+    engine = _make_engine(tmp_path, metrics, pool_size=2, max_overflow=0)
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        assert metrics.snapshot()["checked_out"] == 1
+
+    snapshot = metrics.snapshot()
+    assert snapshot["connects"] == 1
+    assert snapshot["checkouts"] == 1
+    assert snapshot["checkins"] == 1
+    assert snapshot["checked_out"] == 0
+    assert snapshot["size"] == 2
+    assert snapshot["wait_ms"]["count"] == 1
+
+    # As métricas sobrevivem à recriação do pool
+    await engine.dispose()
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    assert metrics.checkouts == 2
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_count_checkout_timeouts(tmp_path):
+    metrics = PoolMetrics()
+    engine = _make_engine(
+        tmp_path, metrics, pool_size=1, max_overflow=0, pool_timeout=0.05
+    )
+
+    async with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            async with engine.connect():
+                pass  # pragma: no cover
+
+    assert metrics.checkout_timeouts == 1
+    assert metrics.wait_ms.count == 2
+    await engine.dispose()
@@ -0,0 +1,69 @@
+from infrastructure.rate_limit import (
+    ConcurrencyLimiter,
+    TokenBucketLimiter,
+    retry_after_header,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_up_to_capacity():
+    limiter = TokenBucketLimiter(capacity=3, period=60, clock=FakeClock())
+
+    assert [limiter.acquire("ip") for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire("ip") == 20  # 1 token a cada 20 s
+    assert limiter.rejected == 1
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(capacity=2, period=10, clock=clock)
+    limiter.acquire("ip")
+    limiter.acquire("ip")
+
+    clock.now = 2.5
+    assert limiter.acquire("ip") == 2.5  # metade de um token reposta
+
+    clock.now = 5
+    assert limiter.acquire("ip") == 0
+
+
+def test_token_bucket_keys_are_independent():
+    limiter = TokenBucketLimiter(capacity=1, period=60, clock=FakeClock())
+
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") > 0
+    assert limiter.acquire("b") == 0
+
+
+def test_token_bucket_memory_is_bounded():
+    limiter = TokenBucketLimiter(
+        capacity=1, period=60, maxsize=2, clock=FakeClock()
+    )
+    for key in ("a", "b", "c"):
+        limiter.acquire(key)
+
+    assert len(limiter) == 2
+    # "a" foi descartada (LRU) e volta com o balde cheio
+    assert limiter.acquire("a") == 0
+
+
+def test_concurrency_limiter_rejects_over_limit():
+    limiter = ConcurrencyLimiter(limit=1)
+
+    assert limiter.try_acquire() is True
+    assert limiter.try_acquire() is False
+    limiter.release()
+    assert limiter.try_acquire() is True
+    assert limiter.stats() == {"limit": 1, "in_flight": 1, "rejected": 1}
+
+
+def test_retry_after_header_rounds_up():
+    assert retry_after_header(0.2) == {"Retry-After": "1"}
+    assert retry_after_header(20.1) == {"Retry-After": "21"}
@@ -0,0 +1,74 @@
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from infrastructure.server_timing import (
+    ServerTimingMiddleware,
+    Timings,
+    instrument_engine_timing,
+    timed,
+)
+
+
+def _metrics(header: str) -> dict[str, float]:
+    return {
+        name: float(dur.removeprefix("dur="))
+        for name, dur in (metric.split(";") for metric in header.split(", "))
+    }
+
+
+def test_timed_outside_request_is_noop():
+    with timed("db"):
+        pass  # sem acumulador ativo: nada a medir nem a falhar
+
+
+def test_timings_header_accumulates_per_metric():
+    timings = Timings()
+    timings.add("db", 0.001)
+    timings.add("db", 0.002)
+    timings.add("hash", 0.05)
+
+    assert timings.counts == {"db": 2, "hash": 1}
+    assert (
+        timings.header(0.1) == "db;dur=3.00, hash;dur=50.00, total;dur=100.00"
+    )
+
+
+def test_middleware_reports_db_and_custom_timings(caplog):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine_timing(engine)
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+        with timed("serialize"):
+            return {"ok": True}
+
+    @app.get("/idle")
+    async def idle():
+        return {}
+
+    client = TestClient(ServerTimingMiddleware(app))
+    with caplog.at_level(logging.INFO, logger="infrastructure.server_timing"):
+        response = client.get("/work")
+
+    metrics = _metrics(response.headers["server-timing"])
+    assert set(metrics) == {"db", "serialize", "total"}
+    assert metrics["total"] >= metrics["db"]
+
+    fields = caplog.records[-1].server_timing
+    assert fields["path"] == "/work"
+    assert fields["status"] == 200
+    assert fields["db_count"] == 2
+    assert "db_ms=" in caplog.records[-1].getMessage()
+
+    # Cada requisição tem o próprio acumulador
+    assert set(_metrics(client.get("/idle").headers["server-timing"])) == {
+        "total"
+    }
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from infrastructure.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = 0
+
+    async def lookup():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    results = await asyncio.gather(
+        *(flight.do("a@ex.com", lookup) for _ in range(5))
+    )
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"executed": 1, "coalesced": 4, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_sequential_and_distinct_keys_are_not_coalesced():
+    flight = SingleFlight()
+
+    async def lookup():
+        await asyncio.sleep(0)
+        return object()
+
+    first = await flight.do("a", lookup)
+    second = await flight.do("a", lookup)
+    await asyncio.gather(flight.do("b", lookup), flight.do("c", lookup))
+
+    assert first is not second
+    assert flight.executed == 4
+    assert flight.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared_with_followers():
+    flight = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("db down")
+
+    results = await asyncio.gather(
+        *(flight.do("a", failing) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.executed == 1
+    assert flight.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_follower_runs_itself_when_leader_is_cancelled():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(10)
+
+    async def fast():
+        return "ok"
+
+    leader = asyncio.create_task(flight.do("a", slow))
+    await started.wait()
+    follower = asyncio.create_task(flight.do("a", fast))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "ok"
+    assert flight.executed == 2
+    assert flight.in_flight == 0
@@ -4,7 +4,7 @@ from pydantic import ValidationError
 from app.models.user import User
 from app.schemas.user_schemas import UserPublic
 from app.value_objects.email_vo import Email
-
+from app.value_objects.password import Password
 from test.factories.models import UserFactory
 
 
@@ -31,6 +31,17 @@ async def test_user_model_creation(session):
     assert user.email.root == user_schema.email.root
 
 
+def test_user_create_reuses_validated_value_objects():
+    email = Email("reuse@example.com")
+    password = Password("S@@ecupass123")
+
+    user = User.create(name="Reuse", email=email, password=password)
+
+    # Já validados no schema: reaproveitados sem nova validação
+    assert user.email is email
+    assert user.password is password
+
+
 def test_user_with_invalid_email_in_model():
     user_data = UserFactory.build()
 
@@ -1,5 +1,12 @@
+import asyncio
+
 import pytest
-from app.repositories.authenticate import get_user_by_email_repo
+
+from app.repositories.authenticate import (
+    get_user_by_email_repo,
+    get_user_public_by_email_repo,
+    user_lookups,
+)
 
 
 @pytest.mark.asyncio
@@ -14,3 +21,33 @@ async def test_get_user_by_email_repo_found(session, user_on_db):
 async def test_get_user_by_email_repo_not_found(session):
     user = await get_user_by_email_repo(session, "nonexistent@example.com")
     assert user is None
+
+
+@pytest.mark.asyncio
+async def test_get_user_public_by_email_repo_skips_password(
+    session, user_on_db
+):
+    row = await get_user_public_by_email_repo(session, user_on_db.email.root)
+
+    assert row.id == user_on_db.id
+    assert row.name == user_on_db.name
+    assert row.email.root == user_on_db.email.root
+    assert "password" not in row._fields
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_query(session, user_on_db):
+    executed = user_lookups.executed
+
+    users = await asyncio.gather(
+        *(
+            get_user_by_email_repo(session, user_on_db.email.root)
+            for _ in range(3)
+        )
+    )
+
+    assert user_lookups.executed == executed + 1
+    # Uma consulta, mas cada chamador com a própria instância, sem sessão
+    assert len({id(user) for user in users}) == len(users)
+    assert all(user not in session for user in users)
+    assert {user.id for user in users} == {user_on_db.id}
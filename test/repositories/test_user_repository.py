@@ -1,9 +1,22 @@
+import datetime
+from http import HTTPStatus
+
 import pytest
+from fastapi import HTTPException
 from pydantic import ValidationError
-from sqlalchemy import select
-from app.repositories.user import create_user_repo
+from sqlalchemy import event, select
+
 from app.models.user import User
-from app.schemas.user_schemas import UserCreate
+from app.repositories.user import (
+    create_user_repo,
+    get_user_by_email_repo,
+    get_users_by_emails_repo,
+    list_users_repo,
+)
+from app.schemas.user_schemas import GetByEmail, UserCreate, UserPublic
+from app.value_objects.email_vo import Email
+from app.value_objects.password import Password, pwd_context
+from test.conftest import engine
 from test.factories.models import UserFactory
 
 
@@ -23,13 +36,13 @@ async def test_create_user_with_invalid_password(session):
     _user = UserFactory.build()
 
     async def assert_validation_error(password_input, expected_msg):
-        user_input = UserCreate(
-            name=_user.name,
-            email=_user.email.root,
-            password=password_input,
-        )
-
+        # A senha é validada no schema, antes de chegar ao repositório
         with pytest.raises(ValidationError) as excinfo:
+            user_input = UserCreate(
+                name=_user.name,
+                email=_user.email.root,
+                password=password_input,
+            )
             await create_user_repo(user_input, session)
 
         # Verifica se a mensagem esperada está contida na lista de erros
@@ -54,3 +67,171 @@ async def test_create_user_repo(session):
     assert user_created.id is not None
     assert user_created.name == _user.name
     assert str(user_created.email) == str(_user.email)
+
+
+@pytest.mark.asyncio
+async def test_create_user_repo_single_statement(session):
+    statements = []
+
+    def _collect(conn, cursor, statement, *args):
+        statements.append(statement.split()[0].upper())
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _collect)
+    try:
+        await create_user_repo(
+            UserCreate(
+                name="Single",
+                email="single@example.com",
+                password="S@@ecupass123",
+            ),
+            session,
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _collect)
+
+    # Nenhum SELECT prévio nem refresh: apenas o INSERT ... RETURNING
+    assert statements == ["INSERT"]
+
+
+@pytest.mark.asyncio
+async def test_create_user_repo_email_already_registered(session, user_on_db):
+    user_input = UserCreate(
+        name="Duplicate",
+        email=user_on_db.email.root,
+        password="S@@ecupass123",
+    )
+
+    with pytest.raises(HTTPException) as excinfo:
+        await create_user_repo(user_input, session)
+
+    assert excinfo.value.status_code == HTTPStatus.BAD_REQUEST
+    assert excinfo.value.detail == "Email already registered."
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_email_repo_projects_public_columns(
+    session, user_on_db
+):
+    row = await get_user_by_email_repo(
+        GetByEmail(email=user_on_db.email.root), session
+    )
+
+    # `updated_at` é a versão usada no ETag; a senha nunca é lida
+    assert row._fields == ("id", "name", "email", "updated_at")
+    assert UserPublic.model_validate(row).id == user_on_db.id
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_email_repo_not_found(session):
+    with pytest.raises(HTTPException) as excinfo:
+        await get_user_by_email_repo(
+            GetByEmail(email="missing@example.com"), session
+        )
+
+    assert excinfo.value.status_code == HTTPStatus.NOT_FOUND
+
+
+async def _add_users(session, names):
+    hashed = pwd_context.hash("DefaultP@ssw0rd!")
+    base = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    users = []
+    for offset, name in enumerate(names):
+        user = User(
+            name=name,
+            email=Email(f"{name}@example.com"),
+            password=Password(hashed),
+        )
+        # Datas fora da ordem de inserção para exercitar o keyset
+        user.created_at = base + datetime.timedelta(minutes=-offset)
+        users.append(user)
+    session.add_all(users)
+    await session.commit()
+    return users
+
+
+@pytest.mark.asyncio
+async def test_list_users_repo_pages_by_id(session):
+    users = await _add_users(session, ["ana", "bia", "caio", "duda", "edu"])
+
+    seen, cursor = [], None
+    while True:
+        rows, cursor = await list_users_repo(session, limit=2, cursor=cursor)
+        seen.extend(row.id for row in rows)
+        if cursor is None:
+            break
+
+    assert seen == sorted(user.id for user in users)
+
+
+@pytest.mark.asyncio
+async def test_list_users_repo_pages_by_created_at_desc(session):
+    await _add_users(session, ["ana", "bia", "caio"])
+
+    first, cursor = await list_users_repo(
+        session, limit=2, sort_by="created_at", order="desc"
+    )
+    second, last = await list_users_repo(
+        session, limit=2, sort_by="created_at", order="desc", cursor=cursor
+    )
+
+    assert [row.name for row in first + second] == ["ana", "bia", "caio"]
+    assert last is None
+
+
+@pytest.mark.asyncio
+async def test_list_users_repo_prefix_filters(session):
+    await _add_users(session, ["ana", "anabel", "bia", "an_x"])
+
+    by_name, _ = await list_users_repo(session, limit=10, name_prefix="ana")
+    by_email, _ = await list_users_repo(session, limit=10, email_prefix="BI")
+    # "_" é literal, não curinga do LIKE
+    escaped, _ = await list_users_repo(session, limit=10, name_prefix="an_")
+
+    assert [row.name for row in by_name] == ["ana", "anabel"]
+    assert [row.email.root for row in by_email] == ["bia@example.com"]
+    assert [row.name for row in escaped] == ["an_x"]
+
+
+@pytest.mark.asyncio
+async def test_list_users_repo_rejects_cursor_from_other_ordering(session):
+    await _add_users(session, ["ana", "bia"])
+    _, cursor = await list_users_repo(session, limit=1)
+
+    for bad in (cursor, "not-a-cursor"):
+        with pytest.raises(HTTPException) as exc:
+            await list_users_repo(
+                session, limit=1, sort_by="created_at", cursor=bad
+            )
+        assert exc.value.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_emails_repo_single_query(session):
+    await _add_users(session, ["ana", "bia"])
+    statements = []
+
+    def _collect(conn, cursor, statement, *args):
+        statements.append(statement.split()[0].upper())
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _collect)
+    try:
+        found = await get_users_by_emails_repo(
+            [
+                Email("ANA@example.com"),
+                Email("bia@example.com"),
+                Email("ana@example.com"),
+                Email("nobody@example.com"),
+            ],
+            session,
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _collect)
+
+    assert statements == ["SELECT"]
+    assert sorted(found) == ["ana@example.com", "bia@example.com"]
+    assert found["bia@example.com"].name == "bia"
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_emails_repo_empty(session):
+    assert await get_users_by_emails_repo([], session) == {}
@@ -1,5 +1,19 @@
 import pytest
 from fastapi import status
+from fastapi.testclient import TestClient
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from sqlalchemy import select
+
+from app.models.user import User
+from app.repositories.authenticate import update_password_hash_repo
+from app.security import login_concurrency
+from app.settings import Settings
+from infrastructure.password_hasher import password_hasher
+from infrastructure.server_timing import ServerTimingMiddleware
+from main import app
+
+settings = Settings()
 
 
 @pytest.mark.asyncio
@@ -91,3 +105,96 @@ async def test_refresh_token_invalid(client):
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json()["detail"] == "Invalid refresh token"
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_password(client, session, user_on_db):
+    legacy = PasswordHash((Argon2Hasher(time_cost=1, memory_cost=8192),))
+    await update_password_hash_repo(
+        session, user_on_db.id, legacy.hash("DefaultP@ssw0rd!")
+    )
+
+    response = client.post(
+        "/auth/",
+        json={
+            "email": user_on_db.email.root,
+            "password": "DefaultP@ssw0rd!",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    # A background task já rodou quando o TestClient devolve a resposta
+    stored = await session.scalar(
+        select(User.password).where(User.id == user_on_db.id)
+    )
+    stored = stored.root.get_secret_value()
+    assert "t=1," not in stored
+    assert f"t={settings.ARGON2_TIME_COST}" in stored
+
+
+@pytest.mark.asyncio
+async def test_login_rate_limited_per_email(client):
+    payload = {"email": "nobody@example.com", "password": "wrongpassword"}
+    for _ in range(settings.LOGIN_RATE_LIMIT_PER_EMAIL):
+        assert client.post("/auth/", json=payload).status_code == 401
+
+    response = client.post("/auth/", json=payload)
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) >= 1
+
+    # Outro email do mesmo IP continua liberado
+    other = {"email": "other@example.com", "password": "wrongpassword"}
+    assert client.post("/auth/", json=other).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_login_rejected_when_concurrency_limit_reached(
+    client, monkeypatch
+):
+    monkeypatch.setattr(login_concurrency, "limit", 0)
+
+    response = client.post(
+        "/auth/",
+        json={"email": "nobody@example.com", "password": "wrongpassword"},
+    )
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_login_returns_503_when_hashing_queue_full(
+    client, user_on_db, monkeypatch
+):
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+
+    response = client.post(
+        "/auth/",
+        json={
+            "email": user_on_db.email.root,
+            "password": "DefaultP@ssw0rd!",
+        },
+    )
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+    assert login_concurrency.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_login_server_timing_breakdown(client, user_on_db):
+    # `client` aplica o override da sessão em `app`
+    timed_client = TestClient(ServerTimingMiddleware(app))
+
+    response = timed_client.post(
+        "/auth/",
+        json={"email": user_on_db.email.root, "password": "DefaultP@ssw0rd!"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    metrics = {
+        metric.split(";")[0]
+        for metric in response.headers["server-timing"].split(", ")
+    }
+    assert {"db", "hash", "jwt", "serialize", "total"} <= metrics
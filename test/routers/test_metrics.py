@@ -0,0 +1,11 @@
+from http import HTTPStatus
+
+
+def test_read_metrics(client):
+    response = client.get("/metrics/")
+
+    assert response.status_code == HTTPStatus.OK
+    assert "db_pool" in response.json()
+    assert "coalesced" in response.json()["user_lookups"]
+    assert "bytes" in response.json()["user_response_cache"]
+    assert response.json()["login_limits"]["concurrency"]["in_flight"] == 0
@@ -1,5 +1,18 @@
+import gzip
+import json
 from http import HTTPStatus
 
+import anyio
+import pytest
+from sqlalchemy import event
+
+from app import security
+from app.http_cache import user_response_cache
+from app.routers.users import settings
+from infrastructure.db_context import get_session
+from main import app
+from test.conftest import engine
+
 
 # 1. Teste de Criação de Usuário
 def test_create_user(client):
@@ -27,7 +40,7 @@ def test_create_user_email_already_exists(client, user_on_db):
         json={
             "name": "Duplicate User",
             "email": user_on_db.email.root,  # Acessa a string do VO Email
-            "password": "S@@ecupassword123",
+            "password": "S@@ecupass123",
         },
     )
 
@@ -35,6 +48,19 @@ def test_create_user_email_already_exists(client, user_on_db):
     assert response.json()["detail"] == "Email already registered."
 
 
+def test_create_user_invalid_fields_rejected_by_schema(client):
+    response = client.post(
+        "/users/",
+        json={"name": "Weak", "email": " WEAK@Example.com ", "password": "a"},
+    )
+
+    # Validado no parse da requisição: 422 com o campo de origem
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    errors = response.json()["detail"]
+    assert [err["loc"] for err in errors] == [["body", "password"]]
+    assert "entre 8 e 16 caracteres" in errors[0]["msg"]
+
+
 # 2. Teste de Leitura Pública (Busca por E-mail)
 def test_get_user_by_email(client, user_on_db):
     # Dependendo de como GetByEmail está definido, pode ser query param
@@ -44,6 +70,31 @@ def test_get_user_by_email(client, user_on_db):
     assert response.json()["name"] == user_on_db.name
 
 
+def test_get_user_by_email_normalizes_like_signup(client):
+    # Cadastro e busca usam o mesmo Value Object: domínio em punycode
+    # continua em punycode (EmailStr o converteria para Unicode)
+    client.post(
+        "/users/",
+        json={
+            "name": "Joe",
+            "email": "Joe@xn--bcher-kva.com",
+            "password": "S@@ecupass1",
+        },
+    )
+
+    response = client.get("/users/", params={"email": "joe@xn--bcher-kva.com"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["email"] == "joe@xn--bcher-kva.com"
+
+
+def test_get_user_by_email_not_found(client):
+    response = client.get("/users/", params={"email": "missing@example.com"})
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json()["detail"] == "User not found."
+
+
 # 3. Teste de Login e Segurança
 def test_login_success(client, user_on_db):
     response = client.post(
@@ -114,12 +165,27 @@ def test_patch_user(client, user_on_db):
     assert response.json()["email"] == "updated@example.com"
 
 
+def test_patch_user_invalid_email_rejected_by_schema(client, user_on_db):
+    client.post(
+        "/auth/",
+        json={"email": user_on_db.email.root, "password": "DefaultP@ssw0rd!"},
+    )
+
+    response = client.patch("/users/", json={"new_email": "not-an-email"})
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert response.json()["detail"][0]["loc"] == ["body", "new_email"]
+
+
 def test_delete_user(client, user_on_db):
     # 1. Login
     client.post(
         "/auth/",
         json={"email": user_on_db.email.root, "password": "DefaultP@ssw0rd!"},
     )
+    access_token = (
+        client.cookies["access_token"].strip('"').removeprefix("Bearer ")
+    )
 
     # 2. Delete (com confirmação True)
     response = client.request(
@@ -131,15 +197,21 @@ def test_delete_user(client, user_on_db):
     assert response.status_code == HTTPStatus.OK
     assert response.json()["message"] == "User deleted successfully"
 
-    # 3. Verifica se o cookie foi removido (o valor fica vazio ou expirado)
-    # No TestClient, verificar se o cookie foi deletado pode variar,
-    # mas tentar acessar /users/me deve falhar agora pois o user foi deletado do banco
-    # OU porque o cookie foi invalidado.
+    # 3. A resposta apaga o cookie: sem credencial, /users/me dá 401
+    assert client.get("/users/me").status_code == HTTPStatus.UNAUTHORIZED
 
-    # Verifica banco de dados (via rota protegida, deve falhar no get_current_user)
-    res_check = client.get("/users/me")
-    # Como o usuário foi deletado do banco, get_current_user retorna 401
-    assert res_check.status_code == HTTPStatus.UNAUTHORIZED
+    # 4. /users/me responde só com as claims do token (não consulta o
+    # banco): um access token emitido antes da exclusão continua aceito
+    # até expirar. Rotas que carregam o usuário já o recusam.
+    headers = {"Authorization": f"Bearer {access_token}"}
+    res_me = client.get("/users/me", headers=headers)
+    assert res_me.status_code == HTTPStatus.OK
+    assert res_me.json()["id"] == user_on_db.id
+
+    res_patch = client.patch(
+        "/users/", json={"name": "Ghost"}, headers=headers
+    )
+    assert res_patch.status_code == HTTPStatus.UNAUTHORIZED
 
 
 def test_logout(client, user_on_db):
@@ -156,3 +228,660 @@ def test_logout(client, user_on_db):
     # 3. Tenta acessar rota protegida
     response_me = client.get("/users/me")
     assert response_me.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_patch_user_from_cached_current_user(client, user_on_db):
+    client.post(
+        "/auth/",
+        json={"email": user_on_db.email.root, "password": "DefaultP@ssw0rd!"},
+    )
+
+    # Primeiro PATCH popula o cache de autenticação
+    response = client.patch("/users/", json={"name": "First Name"})
+    assert response.status_code == HTTPStatus.OK
+
+    # O segundo recebe o usuário do cache (desanexado da sessão original)
+    response = client.patch("/users/", json={"name": "Cached Name"})
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["name"] == "Cached Name"
+
+    # O token foi reemitido com as novas claims
+    assert client.get("/users/me").json()["name"] == "Cached Name"
+
+
+def test_failed_patch_does_not_poison_cached_user(client, user_on_db):
+    client.post(
+        "/users/",
+        json={
+            "name": "Taken",
+            "email": "taken@example.com",
+            "password": "S@@ecupass123",
+        },
+    )
+    client.post(
+        "/auth/",
+        json={"email": user_on_db.email.root, "password": "DefaultP@ssw0rd!"},
+    )
+
+    # Falha com o usuário já em cache: a sessão da requisição faz rollback
+    response = client.patch("/users/", json={"new_email": "taken@example.com"})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    # O usuário em cache não pode ter sido expirado por aquele rollback
+    response = client.patch("/users/", json={"name": "After Failure"})
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["name"] == "After Failure"
+
+    response = client.request("DELETE", "/users/", json={"confirmation": True})
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_read_me_does_not_open_session(client, user_on_db):
+    client.post(
+        "/auth/",
+        json={"email": user_on_db.email.root, "password": "DefaultP@ssw0rd!"},
+    )
+
+    async def fail_session():
+        raise AssertionError("GET /users/me não deve abrir sessão")
+        yield  # pragma: no cover
+
+    app.dependency_overrides[get_session] = fail_session
+
+    response = client.get("/users/me")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["id"] == user_on_db.id
+    assert response.json()["email"] == user_on_db.email.root
+
+
+def test_patch_user_email_reissues_token(client, user_on_db):
+    client.post(
+        "/auth/",
+        json={"email": user_on_db.email.root, "password": "DefaultP@ssw0rd!"},
+    )
+
+    client.patch("/users/", json={"new_email": "renamed@example.com"})
+
+    # O sub antigo deixou de existir; o novo token continua válido
+    response = client.patch("/users/", json={"name": "Renamed"})
+    assert response.status_code == HTTPStatus.OK
+    assert client.get("/users/me").json()["email"] == "renamed@example.com"
+
+
+def _login(client, user):
+    client.post(
+        "/auth/",
+        json={"email": user.email.root, "password": "DefaultP@ssw0rd!"},
+    )
+
+
+@pytest.fixture
+def admin(monkeypatch, user_on_db):
+    """Torna `user_on_db` administrador (rotas de importação/exportação)."""
+    monkeypatch.setattr(security.settings, "ADMIN_USER_IDS", [user_on_db.id])
+    return user_on_db
+
+
+@pytest.mark.parametrize(
+    ("method", "path"),
+    [
+        ("POST", "/users/bulk"),
+        ("GET", "/users/list"),
+        ("GET", "/users/export"),
+    ],
+)
+def test_admin_routes_forbid_regular_users(client, user_on_db, method, path):
+    # Cadastro aberto: estar autenticado não basta
+    _login(client, user_on_db)
+
+    response = client.request(method, path, json=[])
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert response.json()["detail"] == "Admin privileges required"
+
+
+def test_admin_email_does_not_grant_admin_routes(client, user_on_db, admin):
+    # O admin troca de email e libera o endereço antigo
+    old_email = user_on_db.email.root
+    _login(client, user_on_db)
+    client.patch("/users/", json={"new_email": "moved@example.com"})
+    client.cookies.clear()
+
+    client.post(
+        "/users/",
+        json={
+            "name": "Intruder",
+            "email": "intruder@example.com",
+            "password": "S@@ecupass1",
+        },
+    )
+    client.post(
+        "/auth/",
+        json={"email": "intruder@example.com", "password": "S@@ecupass1"},
+    )
+    response = client.patch("/users/", json={"new_email": old_email})
+    assert response.status_code == HTTPStatus.OK
+
+    response = client.get("/users/export")
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+
+
+def test_bulk_create_users_json_array(client, user_on_db, admin):
+    _login(client, user_on_db)
+
+    response = client.post(
+        "/users/bulk",
+        json=[
+            {"name": "A", "email": "a@example.com", "password": "S@@ecupass1"},
+            {"name": "B", "email": "B@example.com", "password": "S@@ecupass2"},
+            {
+                "name": "Dup",
+                "email": user_on_db.email.root,
+                "password": "S@@ecupass3",
+            },
+            {"name": "Bad", "email": "bad@example.com", "password": "short"},
+            {
+                "name": "Again",
+                "email": "a@example.com",
+                "password": "S@@ecupass4",
+            },
+            {"name": "No email"},
+        ],
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    results = {
+        item["index"]: item
+        for item in map(json.loads, response.text.splitlines())
+    }
+
+    assert results[0]["status"] == "created"
+    assert results[1]["status"] == "created"
+    assert results[1]["email"] == "b@example.com"
+    assert results[2]["status"] == "conflict"
+    assert results[3]["status"] == "invalid"
+    assert results[4]["status"] == "conflict"
+    assert results[5]["status"] == "invalid"
+
+    # Os usuários criados conseguem autenticar com a senha enviada
+    login = client.post(
+        "/auth/", json={"email": "a@example.com", "password": "S@@ecupass1"}
+    )
+    assert login.status_code == HTTPStatus.OK
+
+
+def test_bulk_create_users_rejects_values_longer_than_columns(
+    client, user_on_db, admin
+):
+    _login(client, user_on_db)
+
+    # No PostgreSQL, um valor maior que a coluna derrubaria o INSERT do
+    # lote inteiro; o SQLite dos testes não verifica o tamanho
+    response = client.post(
+        "/users/bulk",
+        json=[
+            {"name": "A", "email": "a@example.com", "password": "S@@ecupass1"},
+            {
+                "name": "N" * 101,
+                "email": "long-name@example.com",
+                "password": "S@@ecupass2",
+            },
+            {
+                "name": "Long email",
+                "email": "e" * 244 + "@example.com",
+                "password": "S@@ecupass3",
+            },
+            {"name": "B", "email": "b@example.com", "password": "S@@ecupass4"},
+        ],
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    results = {
+        item["index"]: item
+        for item in map(json.loads, response.text.splitlines())
+    }
+    assert [results[i]["status"] for i in range(4)] == [
+        "created",
+        "invalid",
+        "invalid",
+        "created",
+    ]
+    assert results[1]["errors"][0]["loc"] == ["name"]
+    assert results[2]["errors"][0]["loc"] == ["email"]
+
+
+def test_bulk_create_users_ndjson_stream(client, user_on_db, admin):
+    _login(client, user_on_db)
+    lines = [
+        json.dumps({
+            "name": f"User {i}",
+            "email": f"ndjson{i}@example.com",
+            "password": "S@@ecupass1",
+        })
+        for i in range(3)
+    ]
+
+    response = client.post(
+        "/users/bulk",
+        content="\n".join(lines + ["{not json"]),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    statuses = [
+        json.loads(line)["status"] for line in response.text.splitlines()
+    ]
+    assert sorted(statuses) == ["created", "created", "created", "invalid"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_users_ndjson_answers_each_batch_as_it_arrives(
+    client, user_on_db, monkeypatch, admin
+):
+    _login(client, user_on_db)
+    monkeypatch.setattr(settings, "USER_BULK_BATCH_SIZE", 2)
+    # Um lote por pedaço do corpo, como chegaria pela rede
+    chunks = [
+        "".join(
+            json.dumps({
+                "name": f"User {i}",
+                "email": f"chunk{i}@example.com",
+                "password": "S@@ecupass1",
+            })
+            + "\n"
+            for i in range(start, start + 2)
+        ).encode()
+        for start in (0, 2, 4)
+    ]
+    received = 0
+    received_at_first_result = None
+    lines = []
+
+    async def receive():
+        nonlocal received
+        if received == len(chunks):
+            # Conexão aberta: só termina com a resposta
+            await anyio.sleep_forever()
+        received += 1
+        return {
+            "type": "http.request",
+            "body": chunks[received - 1],
+            "more_body": received < len(chunks),
+        }
+
+    async def send(message):
+        nonlocal received_at_first_result
+        if message["type"] == "http.response.body" and message["body"]:
+            if received_at_first_result is None:
+                received_at_first_result = received
+            lines.extend(message["body"].decode().splitlines())
+
+    cookie = "; ".join(f"{k}={v}" for k, v in client.cookies.items())
+    scope = {
+        "type": "http",
+        # Mesma versão anunciada pelo uvicorn
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/users/bulk",
+        "raw_path": b"/users/bulk",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", b"application/x-ndjson"),
+            (b"cookie", cookie.encode()),
+        ],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    with anyio.fail_after(10):
+        await app(scope, receive, send)
+
+    # O primeiro lote foi respondido antes do restante do corpo chegar
+    assert received_at_first_result == 1
+    assert [json.loads(line)["index"] for line in lines] == list(range(6))
+    assert {json.loads(line)["status"] for line in lines} == {"created"}
+
+
+def test_bulk_create_users_ndjson_item_limit(
+    client, user_on_db, monkeypatch, admin
+):
+    _login(client, user_on_db)
+    monkeypatch.setattr(settings, "USER_BULK_MAX_ITEMS", 2)
+    lines = [
+        json.dumps({
+            "name": f"User {i}",
+            "email": f"limit{i}@example.com",
+            "password": "S@@ecupass1",
+        })
+        for i in range(4)
+    ]
+
+    response = client.post(
+        "/users/bulk",
+        content="\n".join(lines),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    # A resposta já começou: o excesso vira um último resultado `invalid`
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["status"] for r in results] == ["created", "created", "invalid"]
+    assert results[-1]["errors"][0]["type"] == "too_many_items"
+
+
+def test_bulk_create_users_json_array_item_limit(
+    client, user_on_db, monkeypatch, admin
+):
+    _login(client, user_on_db)
+    monkeypatch.setattr(settings, "USER_BULK_MAX_ITEMS", 1)
+
+    response = client.post("/users/bulk", json=[{}, {}])
+
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+
+def test_bulk_create_users_requires_array(client, user_on_db, admin):
+    _login(client, user_on_db)
+
+    response = client.post("/users/bulk", json={"name": "Not a list"})
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_bulk_create_users_unauthorized(client):
+    response = client.post("/users/bulk", json=[])
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_list_users_paginates_with_cursor(client, user_on_db, admin):
+    _login(client, user_on_db)
+    client.post(
+        "/users/",
+        json={
+            "name": "Second",
+            "email": "second@example.com",
+            "password": "S@@ecupass123",
+        },
+    )
+
+    first = client.get("/users/list", params={"limit": 1})
+    assert first.status_code == HTTPStatus.OK
+    assert [u["email"] for u in first.json()["items"]] == [
+        user_on_db.email.root
+    ]
+
+    second = client.get(
+        "/users/list",
+        params={"limit": 1, "cursor": first.json()["next_cursor"]},
+    )
+    assert second.json() == {
+        "items": [
+            {
+                "id": user_on_db.id + 1,
+                "name": "Second",
+                "email": "second@example.com",
+            }
+        ],
+        "next_cursor": None,
+    }
+
+
+def test_list_users_validates_params(client, user_on_db, admin):
+    _login(client, user_on_db)
+
+    assert (
+        client.get("/users/list", params={"limit": 0}).status_code
+        == HTTPStatus.UNPROCESSABLE_ENTITY
+    )
+    assert (
+        client.get("/users/list", params={"cursor": "x"}).status_code
+        == HTTPStatus.BAD_REQUEST
+    )
+
+
+def test_list_users_unauthorized(client):
+    response = client.get("/users/list")
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_export_users_ndjson(client, user_on_db, admin):
+    _login(client, user_on_db)
+
+    response = client.get("/users/export")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert 'filename="users.ndjson"' in response.headers["content-disposition"]
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {
+            "id": user_on_db.id,
+            "name": user_on_db.name,
+            "email": user_on_db.email.root,
+        }
+    ]
+
+
+def test_export_users_csv_gzip(client, user_on_db, admin):
+    _login(client, user_on_db)
+
+    response = client.get(
+        "/users/export", params={"format": "csv", "gzip": True}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/gzip"
+    assert gzip.decompress(response.content).decode().splitlines() == [
+        "id,name,email",
+        f"{user_on_db.id},{user_on_db.name},{user_on_db.email.root}",
+    ]
+
+
+def test_export_users_unauthorized(client):
+    assert client.get("/users/export").status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_lookup_users_preserves_input_order(client, user_on_db):
+    _login(client, user_on_db)
+    email = user_on_db.email.root
+
+    response = client.post(
+        "/users/lookup",
+        json={
+            "emails": [
+                "missing@example.com",
+                email.upper(),
+                "not-an-email",
+                email,
+            ]
+        },
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    user = {"id": user_on_db.id, "name": user_on_db.name, "email": email}
+    assert response.json() == [
+        {"email": "missing@example.com", "status": "not_found", "user": None},
+        {"email": email.upper(), "status": "found", "user": user},
+        {"email": "not-an-email", "status": "invalid", "user": None},
+        {"email": email, "status": "found", "user": user},
+    ]
+
+
+def test_lookup_users_limits(client, user_on_db, monkeypatch):
+    _login(client, user_on_db)
+    monkeypatch.setattr(settings, "USER_LOOKUP_MAX_EMAILS", 2)
+
+    too_many = client.post(
+        "/users/lookup", json={"emails": ["a@ex.com", "b@ex.com", "c@ex.com"]}
+    )
+    empty = client.post("/users/lookup", json={"emails": []})
+
+    assert too_many.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert empty.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_lookup_users_unauthorized(client):
+    response = client.post("/users/lookup", json={"emails": ["a@ex.com"]})
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_get_user_by_email_conditional_get(client, user_on_db):
+    params = {"email": user_on_db.email.root}
+    first = client.get("/users/", params=params)
+    etag = first.headers["etag"]
+
+    assert etag.startswith('W/"')
+    assert "last-modified" in first.headers
+
+    revalidated = client.get(
+        "/users/", params=params, headers={"If-None-Match": etag}
+    )
+    assert revalidated.status_code == HTTPStatus.NOT_MODIFIED
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    by_date = client.get(
+        "/users/",
+        params=params,
+        headers={"If-Modified-Since": first.headers["last-modified"]},
+    )
+    assert by_date.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_read_me_conditional_get_without_session(client, user_on_db):
+    _login(client, user_on_db)
+    etag = client.get("/users/me").headers["etag"]
+
+    async def fail_session():
+        raise AssertionError("GET /users/me não deve abrir sessão")
+        yield  # pragma: no cover
+
+    app.dependency_overrides[get_session] = fail_session
+    response = client.get("/users/me", headers={"If-None-Match": etag})
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["etag"] == etag
+
+
+def test_read_me_etag_changes_after_patch(client, user_on_db):
+    _login(client, user_on_db)
+    etag = client.get("/users/me").headers["etag"]
+
+    client.patch("/users/", json={"name": "Renamed"})
+    response = client.get("/users/me", headers={"If-None-Match": etag})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["name"] == "Renamed"
+    assert response.headers["etag"] != etag
+
+
+@pytest.fixture
+def response_cache(monkeypatch):
+    monkeypatch.setattr(settings, "USER_RESPONSE_CACHE_ENABLED", True)
+    return user_response_cache
+
+
+def test_get_user_response_cache_serves_without_query(
+    client, user_on_db, response_cache
+):
+    params = {"email": user_on_db.email.root.upper()}
+    first = client.get("/users/", params=params)
+
+    statements = []
+
+    def _collect(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    # A sessão é preguiçosa: sem consulta, nenhuma conexão é usada
+    event.listen(engine.sync_engine, "before_cursor_execute", _collect)
+    try:
+        second = client.get("/users/", params=params)
+        revalidated = client.get(
+            "/users/",
+            params=params,
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _collect)
+
+    assert statements == []
+
+    assert second.status_code == HTTPStatus.OK
+    assert second.json() == first.json()
+    assert second.headers["etag"] == first.headers["etag"]
+    assert revalidated.status_code == HTTPStatus.NOT_MODIFIED
+    assert response_cache.stats()["hits"] == 2
+
+
+def test_get_user_response_cache_negative_entry_invalidated_on_create(
+    client, response_cache
+):
+    params = {"email": "later@example.com"}
+    missing = client.get("/users/", params=params)
+
+    assert missing.status_code == HTTPStatus.NOT_FOUND
+    assert missing.json() == {"detail": "User not found."}
+    assert "later@example.com" in response_cache
+
+    client.post(
+        "/users/",
+        json={
+            "name": "Later",
+            "email": "later@example.com",
+            "password": "S@@ecupass123",
+        },
+    )
+
+    assert client.get("/users/", params=params).json()["name"] == "Later"
+
+
+def test_get_user_response_cache_invalidated_on_patch_and_delete(
+    client, user_on_db, response_cache
+):
+    _login(client, user_on_db)
+    params = {"email": user_on_db.email.root}
+    client.get("/users/", params=params)
+
+    client.patch("/users/", json={"name": "Renamed"})
+    assert client.get("/users/", params=params).json()["name"] == "Renamed"
+
+    client.request("DELETE", "/users/", json={"confirmation": True})
+    assert (
+        client.get("/users/", params=params).status_code
+        == HTTPStatus.NOT_FOUND
+    )
+
+
+def test_get_user_response_cache_invalidated_on_bulk_create(
+    client, user_on_db, response_cache, admin
+):
+    _login(client, user_on_db)
+    params = {"email": "bulk-cached@example.com"}
+    client.get("/users/", params=params)
+
+    client.post(
+        "/users/bulk",
+        json=[
+            {
+                "name": "Bulk",
+                "email": "bulk-cached@example.com",
+                "password": "S@@ecupass123",
+            }
+        ],
+    )
+
+    assert client.get("/users/", params=params).status_code == HTTPStatus.OK
+
+
+def test_user_routes_still_document_user_public(client):
+    paths = client.get("/openapi.json").json()["paths"]
+    schema = paths["/users/me"]["get"]["responses"]["200"]["content"][
+        "application/json"
+    ]["schema"]
+
+    assert schema == {"$ref": "#/components/schemas/UserPublic"}
@@ -0,0 +1,53 @@
+import json
+
+from pydantic import SecretStr
+
+from app.models.user import User
+from app.schemas.responses import (
+    UserPublicResponse,
+    dump_user_page,
+    dump_user_public,
+)
+from app.schemas.user_schemas import UserPage, UserPublic
+from app.security import Principal
+from app.value_objects.email_vo import Email
+from app.value_objects.password import Password
+
+
+def _user() -> User:
+    user = User(
+        name='José "Zé" Ñandú',
+        email=Email("jose@example.com"),
+        password=Password(root=SecretStr("DefaultP@ssw0rd!")),
+    )
+    user.id = 42
+    return user
+
+
+def test_dump_user_public_matches_pydantic_output():
+    user = _user()
+    principal = Principal(id=42, name=user.name, email="jose@example.com")
+    expected = UserPublic.model_validate(user).model_dump_json().encode()
+
+    assert dump_user_public(user) == expected
+    assert dump_user_public(principal) == expected
+
+
+def test_dump_user_page_matches_pydantic_output():
+    user = _user()
+
+    expected = UserPage(items=[user], next_cursor="abc").model_dump_json()
+
+    assert dump_user_page([user], "abc") == expected.encode()
+    assert json.loads(dump_user_page([], None)) == {
+        "items": [],
+        "next_cursor": None,
+    }
+
+
+def test_user_public_response_renders_json():
+    response = UserPublicResponse(_user(), status_code=201)
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body)["email"] == "jose@example.com"
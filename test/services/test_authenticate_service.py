@@ -1,11 +1,27 @@
-import pytest
-import jwt
 from datetime import timedelta
+
+import jwt
+import pytest
+from freezegun import freeze_time
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from sqlalchemy import select
+
+from app.models.user import User
+from app.repositories.authenticate import update_password_hash_repo
+from app.services import authenticate as authenticate_service
 from app.services.authenticate import (
-    create_access_token_service,
     authenticate_user_service,
+    create_access_token_service,
+    decode_token_service,
+    token_cache,
 )
 from app.settings import Settings
+from app.value_objects.password import pwd_context
+from infrastructure.password_hasher import (
+    PasswordHasherBusyError,
+    password_hasher,
+)
 
 settings = Settings()
 
@@ -56,9 +72,97 @@ async def test_authenticate_user_service_user_not_found(session):
     assert user is None
 
 
+@pytest.mark.asyncio
+async def test_authenticate_user_service_unknown_email_uses_hasher(
+    session, monkeypatch
+):
+    # Com o pool cheio, o verify fictício também é recusado: prova que
+    # o email inexistente passa pelo mesmo caminho de hashing
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+
+    with pytest.raises(PasswordHasherBusyError):
+        await authenticate_user_service(
+            session, "nonexistent@example.com", "password"
+        )
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_service_dummy_verify_disabled(
+    session, monkeypatch
+):
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+    monkeypatch.setattr(
+        authenticate_service.settings, "LOGIN_DUMMY_VERIFY_ENABLED", False
+    )
+
+    user = await authenticate_user_service(
+        session, "nonexistent@example.com", "password"
+    )
+    assert user is None
+
+
 @pytest.mark.asyncio
 async def test_authenticate_user_service_wrong_password(session, user_on_db):
     user = await authenticate_user_service(
         session, user_on_db.email.root, "WrongPassword123!"
     )
     assert user is None
+
+
+def test_decode_token_service_caches_payload():
+    token = create_access_token_service({"sub": "test@example.com"})
+
+    first = decode_token_service(token)
+    second = decode_token_service(token)
+
+    assert first["sub"] == "test@example.com"
+    assert second is first
+    assert token_cache.stats()["hits"] == 1
+
+
+def test_decode_token_service_rejects_invalid_token():
+    with pytest.raises(jwt.PyJWTError):
+        decode_token_service("invalid_token")
+
+    assert len(token_cache) == 0
+
+
+def test_decode_token_service_never_outlives_exp():
+    with freeze_time("2024-01-01 12:00:00"):
+        token = create_access_token_service(
+            {"sub": "test@example.com"}, expires_delta=timedelta(minutes=10)
+        )
+
+    with freeze_time("2024-01-01 12:05:00"):
+        assert decode_token_service(token)["sub"] == "test@example.com"
+
+    # Mesmo em cache, o token expirado volta a ser rejeitado
+    with (
+        freeze_time("2024-01-01 12:11:00"),
+        pytest.raises(jwt.ExpiredSignatureError),
+    ):
+        decode_token_service(token)
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_service_rehashes_outdated_hash(
+    session, user_on_db
+):
+    # Hash gerado com parâmetros mais fracos que os atuais
+    legacy = PasswordHash((Argon2Hasher(time_cost=1, memory_cost=8192),))
+    await update_password_hash_repo(
+        session, user_on_db.id, legacy.hash("DefaultP@ssw0rd!")
+    )
+
+    user = await authenticate_user_service(
+        session, user_on_db.email.root, "DefaultP@ssw0rd!"
+    )
+    assert user is not None
+
+    stored = await session.scalar(
+        select(User.password).where(User.id == user_on_db.id)
+    )
+    stored = stored.root.get_secret_value()
+    assert f"t={settings.ARGON2_TIME_COST}" in stored
+    assert f"m={settings.ARGON2_MEMORY_COST}" in stored
+    assert pwd_context.verify("DefaultP@ssw0rd!", stored)
@@ -0,0 +1,103 @@
+import csv
+import gzip
+import io
+import json
+import tracemalloc
+
+import pytest
+from sqlalchemy import insert
+
+from app.models.user import User
+from app.services.user_export import export_users_service
+from app.value_objects.data_time_sp import tz_sp_now
+from app.value_objects.password import pwd_context
+
+
+async def _add_synthetic_users(session, start, count):
+    hashed = pwd_context.hash("DefaultP@ssw0rd!")
+    now = tz_sp_now()
+    await session.execute(
+        insert(User),
+        [
+            {
+                "name": f"User {i}",
+                "email": f"user{i}@example.com",
+                "password": hashed,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(start, start + count)
+        ],
+    )
+    await session.commit()
+
+
+async def _collect(session, fmt, compress=False, batch_size=100):
+    chunks = [
+        chunk
+        async for chunk in export_users_service(
+            session, fmt, batch_size=batch_size, compress=compress
+        )
+    ]
+    return b"".join(chunks), len(chunks)
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_matches_user_public(session, user_on_db):
+    body, _ = await _collect(session, "ndjson")
+
+    assert [json.loads(line) for line in body.splitlines()] == [
+        {
+            "id": user_on_db.id,
+            "name": user_on_db.name,
+            "email": user_on_db.email.root,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_csv_streams_one_chunk_per_batch(session):
+    await _add_synthetic_users(session, 0, 250)
+
+    body, chunks = await _collect(session, "csv", batch_size=100)
+
+    rows = list(csv.reader(io.StringIO(body.decode())))
+    assert rows[0] == ["id", "name", "email"]
+    assert len(rows) == 251
+    assert rows[1] == ["1", "User 0", "user0@example.com"]
+    assert chunks == 1 + 3  # cabeçalho + 3 lotes
+
+
+@pytest.mark.asyncio
+async def test_export_gzip_roundtrip(session):
+    await _add_synthetic_users(session, 0, 50)
+
+    plain, _ = await _collect(session, "ndjson")
+    compressed, _ = await _collect(session, "ndjson", compress=True)
+
+    assert gzip.decompress(compressed) == plain
+
+
+@pytest.mark.asyncio
+async def test_export_memory_is_bounded_by_batch_not_table(session):
+    async def peak_while_exporting() -> tuple[int, int]:
+        tracemalloc.start()
+        total = 0
+        try:
+            async for chunk in export_users_service(
+                session, "ndjson", batch_size=500
+            ):
+                total += len(chunk)  # consome e descarta, como o socket
+            return tracemalloc.get_traced_memory()[1], total
+        finally:
+            tracemalloc.stop()
+
+    await _add_synthetic_users(session, 0, 2_000)
+    small_peak, small_total = await peak_while_exporting()
+
+    await _add_synthetic_users(session, 2_000, 18_000)
+    large_peak, large_total = await peak_while_exporting()
+
+    # 10x mais dados exportados, pico de memória praticamente igual
+    assert large_total > 9 * small_total
+    assert large_peak < small_peak * 1.5
@@ -0,0 +1,82 @@
+import datetime
+from unittest.mock import MagicMock
+
+from fastapi import Request
+
+from app.http_cache import conditional_response, epoch_us, weak_etag
+
+UPDATED = datetime.datetime(2026, 3, 1, 12, 0, 0, 250, tzinfo=datetime.UTC)
+UPDATED_US = epoch_us(UPDATED)
+
+
+def _request(**headers) -> Request:
+    request = MagicMock(spec=Request)
+    request.headers = {k.replace("_", "-"): v for k, v in headers.items()}
+    return request
+
+
+def test_epoch_us_treats_naive_as_utc():
+    naive = UPDATED.replace(tzinfo=None)
+    sao_paulo = UPDATED.astimezone(
+        datetime.timezone(datetime.timedelta(hours=-3))
+    )
+
+    assert epoch_us(naive) == epoch_us(UPDATED) == epoch_us(sao_paulo)
+    assert UPDATED_US % 1_000_000 == 250
+
+
+def test_conditional_response_sets_validators():
+    not_modified, headers = conditional_response(_request(), 7, UPDATED_US)
+
+    assert not_modified is None
+    assert headers == {
+        "ETag": weak_etag(7, UPDATED_US),
+        "Last-Modified": "Sun, 01 Mar 2026 12:00:00 GMT",
+        "Cache-Control": "private, no-cache",
+    }
+
+
+def test_conditional_response_if_none_match():
+    etag = weak_etag(7, UPDATED_US)
+
+    for header in (etag, etag.removeprefix("W/"), f'"x", {etag}', "*"):
+        not_modified, _ = conditional_response(
+            _request(if_none_match=header), 7, UPDATED_US
+        )
+        assert not_modified.status_code == 304
+
+    changed, _ = conditional_response(
+        _request(if_none_match=etag), 7, UPDATED_US + 1
+    )
+    assert changed is None
+
+
+def test_conditional_response_if_modified_since():
+    def check(header):
+        return conditional_response(
+            _request(if_modified_since=header), 7, UPDATED_US
+        )[0]
+
+    assert check("Sun, 01 Mar 2026 12:00:00 GMT").status_code == 304
+    assert check("Sun, 01 Mar 2026 11:59:59 GMT") is None
+    assert check("not a date") is None
+
+
+def test_if_none_match_takes_precedence():
+    not_modified, _ = conditional_response(
+        _request(
+            if_none_match='W/"stale"',
+            if_modified_since="Sun, 01 Mar 2026 12:00:00 GMT",
+        ),
+        7,
+        UPDATED_US,
+    )
+
+    assert not_modified is None
+
+
+def test_conditional_response_without_version():
+    assert conditional_response(_request(if_none_match="*"), 7, None) == (
+        None,
+        {},
+    )
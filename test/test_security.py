@@ -1,10 +1,17 @@
-import pytest
+from datetime import UTC, timedelta
 from unittest.mock import MagicMock
-from fastapi import Request, HTTPException, status
+
+import pytest
+from fastapi import HTTPException, Request, status
 from freezegun import freeze_time
-from datetime import timedelta
 
-from app.security import get_current_user
+from app.security import (
+    Principal,
+    get_current_claims,
+    get_current_user,
+    invalidate_cached_user,
+    user_cache,
+)
 from app.services.authenticate import create_access_token_service
 
 
@@ -116,12 +123,14 @@ async def test_get_current_user_expired_token(session, user_on_db):
 async def test_get_current_user_invalid_type(session, user_on_db):
     # Token válido, mas com tipo errado (ex: refresh token)
     # Precisamos gerar manualmente para sobrescrever o 'type'
-    from datetime import datetime, timezone
+    from datetime import datetime
+
     import jwt
+
     from app.settings import Settings
 
     settings = Settings()
-    now = datetime.now(timezone.utc)
+    now = datetime.now(UTC)
     data = {
         "sub": user_on_db.email.root,
         "exp": now + timedelta(minutes=10),
@@ -138,3 +147,81 @@ async def test_get_current_user_invalid_type(session, user_on_db):
         await get_current_user(request, session)
 
     assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_uses_cache(session, user_on_db):
+    token = create_access_token_service({"sub": user_on_db.email.root})
+
+    request = MagicMock(spec=Request)
+    request.cookies.get.return_value = token
+    request.headers.get.return_value = None
+
+    first = await get_current_user(request, session)
+
+    # Cópia desanexada: fora da sessão da requisição, imune ao rollback
+    email = user_on_db.email.root
+    assert first not in session
+    await session.rollback()
+    assert first.email.root == email
+
+    # Remove o usuário do banco: o cache ainda deve atendê-lo
+    await session.delete(await session.merge(first, load=False))
+    await session.commit()
+
+    cached = await get_current_user(request, session)
+    assert cached is first
+    assert user_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cached_user_forces_db_lookup(session, user_on_db):
+    token = create_access_token_service({"sub": user_on_db.email.root})
+
+    request = MagicMock(spec=Request)
+    request.cookies.get.return_value = token
+    request.headers.get.return_value = None
+
+    user = await get_current_user(request, session)
+    await session.delete(await session.merge(user, load=False))
+    await session.commit()
+
+    invalidate_cached_user(user_on_db.email.root)
+
+    with pytest.raises(HTTPException) as excinfo:
+        await get_current_user(request, session)
+
+    assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_get_current_claims_success():
+    token = create_access_token_service({
+        "sub": "claims@example.com",
+        "id": 7,
+        "name": "Claims",
+    })
+
+    request = MagicMock(spec=Request)
+    request.cookies.get.return_value = token
+    request.headers.get.return_value = None
+
+    principal = await get_current_claims(request)
+    assert principal == Principal(
+        id=7, name="Claims", email="claims@example.com"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_current_claims_missing_id():
+    # Tokens sem as claims de perfil não servem para o modo somente-claims
+    token = create_access_token_service({"sub": "claims@example.com"})
+
+    request = MagicMock(spec=Request)
+    request.cookies.get.return_value = token
+    request.headers.get.return_value = None
+
+    with pytest.raises(HTTPException) as excinfo:
+        await get_current_claims(request)
+
+    assert excinfo.value.status_code == status.HTTP_401_UNAUTHORIZED
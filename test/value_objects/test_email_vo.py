@@ -1,5 +1,6 @@
 import pytest
 from pydantic import ValidationError
+
 from app.value_objects.email_vo import Email
 
 
@@ -18,6 +19,7 @@ def test_email_invalid_cases():
         "username@com",
         "username@domain..com",
         "   ",  # Empty after strip
+        "a" * 244 + "@example.com",  # Maior que a coluna (255)
     ]
 
     for invalid_email in invalid_emails:
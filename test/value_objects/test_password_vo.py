@@ -1,6 +1,7 @@
 import pytest
-from pydantic import ValidationError, SecretStr
-from app.value_objects.password import Password
+from pydantic import SecretStr, ValidationError
+
+from app.value_objects.password import Password, is_supported_hash
 
 
 def test_password_valid_creation():
@@ -51,3 +52,13 @@ def test_password_skip_validation_for_hash():
     existing_hash = "$argon2id$v=19$m=65536,t=3,p=4$..."
     pwd = Password(existing_hash)
     assert pwd.root.get_secret_value() == existing_hash
+
+
+def test_is_supported_hash():
+    assert is_supported_hash(Password.hash_password("S@@ecupass123"))
+    assert not is_supported_hash("$argon2garbage")
+    assert not is_supported_hash("$2b$12$notanargon2hashatall")
+    # Parâmetros fora dos mínimos do Argon2
+    assert not is_supported_hash(
+        "$argon2id$v=19$m=0,t=0,p=0$c29tZXNhbHQ$aGFzaGhhc2hoYXNo"
+    )